@@ -109,9 +109,9 @@ class CacheCleaner:
         """Loop principal de limpieza."""
         while self._running:
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 items_removed = self._perform_cleanup()
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 # Actualizar estadísticas
                 self._cleanup_stats['total_cleanups'] += 1
@@ -767,10 +767,10 @@ class EventManager:
             event: Evento a procesar
             process_func: Función de procesamiento
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             process_func(event)
-            self._update_metrics(event, time.time() - start_time)
+            self._update_metrics(event, time.perf_counter() - start_time)
             self._check_patterns(event)
         except Exception as e:
             self.metrics.failed_events += 1
@@ -3,12 +3,13 @@
 import logging
 import time
 import threading
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Mapping, Union
 from datetime import datetime, timedelta
 import json
 import pickle
 import hashlib
 from pathlib import Path
+from types import MappingProxyType
 
 from .cache import CacheBackend
 from .metrics import MetricsManager
@@ -27,6 +28,23 @@ from .cache.auth import AuthManager, Permission, Role
 
 logger = logging.getLogger(__name__)
 
+class NodeEntry:
+    """Estado de un nodo de la caché distribuida.
+    
+    Agrupa la configuración, el cliente, el estado y el circuit breaker de
+    un nodo para resolverlos con una sola búsqueda por ID.
+    """
+    
+    __slots__ = ('id', 'type', 'config', 'client', 'status', 'breaker')
+    
+    def __init__(self, config: Dict[str, Any], breaker: CircuitBreaker):
+        self.id = config['id']
+        self.type = config['type']
+        self.config = config
+        self.client = config.get('client')
+        self.status = True
+        self.breaker = breaker
+
 class DistributedCache(CacheBackend):
     """Implementación de caché distribuida."""
     
@@ -110,16 +128,14 @@ class DistributedCache(CacheBackend):
             auth_file=auth_file
         )
         
-        # Circuit breakers por nodo
-        self.circuit_breakers = {
-            node['id']: CircuitBreaker(
-                operation_timeout=operation_timeout
+        # Estado interno por nodo (configuración, cliente, estado y circuit breaker)
+        self._entries: Dict[str, NodeEntry] = {
+            node['id']: NodeEntry(
+                node,
+                CircuitBreaker(operation_timeout=operation_timeout)
             )
             for node in nodes
         }
-        
-        # Estado interno
-        self.node_status = {node['id']: True for node in nodes}
         self._initialize_connections()
         
         # Iniciar componentes
@@ -130,19 +146,39 @@ class DistributedCache(CacheBackend):
         
         logger.info("Distributed cache initialized")
     
+    @property
+    def node_status(self) -> Mapping[str, bool]:
+        """Estado de disponibilidad por nodo (vista de solo lectura).
+        
+        El estado vive en cada NodeEntry; asignar sobre esta vista lanza
+        TypeError en lugar de perderse en silencio.
+        """
+        return MappingProxyType(
+            {node_id: entry.status for node_id, entry in self._entries.items()}
+        )
+    
+    @property
+    def circuit_breakers(self) -> Mapping[str, CircuitBreaker]:
+        """Circuit breakers por nodo (vista de solo lectura)."""
+        return MappingProxyType(
+            {node_id: entry.breaker for node_id, entry in self._entries.items()}
+        )
+    
     def _initialize_connections(self) -> None:
         """Inicializa conexiones a los nodos."""
-        for node in self.nodes:
+        for entry in self._entries.values():
+            node = entry.config
             try:
-                if node['type'] == 'redis':
+                if entry.type == 'redis':
                     self._init_redis_connection(node)
-                elif node['type'] == 'memcached':
+                elif entry.type == 'memcached':
                     self._init_memcached_connection(node)
                 else:
-                    raise CacheError(f"Unsupported cache type: {node['type']}")
+                    raise CacheError(f"Unsupported cache type: {entry.type}")
+                entry.client = node['client']
             except Exception as e:
-                logger.error(f"Error connecting to node {node['id']}: {str(e)}")
-                self.node_status[node['id']] = False
+                logger.error(f"Error connecting to node {entry.id}: {str(e)}")
+                entry.status = False
     
     def _init_redis_connection(self, node: Dict[str, Any]) -> None:
         """Inicializa conexión Redis."""
@@ -255,13 +291,13 @@ class DistributedCache(CacheBackend):
         Args:
             operation: Nombre de la operación
             success: Si la operación fue exitosa
-            start_time: Tiempo de inicio
+            start_time: Instante de inicio (time.perf_counter)
             metadata: Metadatos adicionales
         """
         if not self.metrics:
             return
         
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         if operation == 'get':
             if success:
@@ -293,7 +329,7 @@ class DistributedCache(CacheBackend):
         Returns:
             Any: Valor almacenado o default
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             # Verificar autenticación
             if token and not self.auth.has_permission(token, Permission.READ):
@@ -314,9 +350,10 @@ class DistributedCache(CacheBackend):
             # Intentar leer de nodos
             for node_id in nodes:
                 try:
-                    node = self._get_node(node_id)
-                    if not node:
+                    entry = self._entries.get(node_id)
+                    if entry is None:
                         continue
+                    node = entry.config
                     
                     # Usar circuit breaker
                     def read_operation():
@@ -326,7 +363,7 @@ class DistributedCache(CacheBackend):
                         logger.warning(f"Circuit open for node {node_id}")
                         return None
                     
-                    node_value = self.circuit_breakers[node_id].execute(
+                    node_value = entry.breaker.execute(
                         read_operation,
                         fallback
                     )
@@ -404,7 +441,7 @@ class DistributedCache(CacheBackend):
         Returns:
             bool: True si se almacenó correctamente
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         metadata = {
             'writes_attempted': 0,
             'writes_succeeded': 0,
@@ -440,9 +477,9 @@ class DistributedCache(CacheBackend):
             
             def fallback():
                 # Intentar escribir en cualquier nodo disponible
-                for node in self.nodes:
+                for entry in self._entries.values():
                     try:
-                        if self._set_in_node(node, key, value, ttl):
+                        if self._set_in_node(entry.config, key, value, ttl):
                             return True
                     except:
                         continue
@@ -511,7 +548,7 @@ class DistributedCache(CacheBackend):
         Returns:
             bool: True si se eliminó correctamente
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         metadata = {
             'deletes_attempted': 0,
             'deletes_succeeded': 0,
@@ -528,28 +565,30 @@ class DistributedCache(CacheBackend):
             successful_writes = 0
             
             # Eliminar del nodo primario
-            if self.node_status[partition.node_id]:
+            primary = self._entries[partition.node_id]
+            if primary.status:
                 try:
-                    self._delete_from_node(self._get_node(partition.node_id), key)
+                    self._delete_from_node(primary.config, key)
                     successful_writes += 1
                 except Exception as e:
                     logger.error(f"Error deleting from primary node: {str(e)}")
-                    self.node_status[partition.node_id] = False
+                    primary.status = False
             
             # Eliminar de réplicas
             for replica_id in partition.replica_nodes:
-                if not self.node_status[replica_id]:
+                replica = self._entries[replica_id]
+                if not replica.status:
                     continue
                 
                 try:
-                    self._delete_from_node(self._get_node(replica_id), key)
+                    self._delete_from_node(replica.config, key)
                     successful_writes += 1
                     
                     if successful_writes >= required_writes:
                         break
                 except Exception as e:
                     logger.error(f"Error deleting from replica node: {str(e)}")
-                    self.node_status[replica_id] = False
+                    replica.status = False
             
             if successful_writes < required_writes:
                 raise CacheError(
@@ -581,15 +620,15 @@ class DistributedCache(CacheBackend):
     
     def clear(self) -> None:
         """Limpia toda la caché distribuida."""
-        for node in self.nodes:
-            if not self.node_status[node['id']]:
+        for entry in self._entries.values():
+            if not entry.status:
                 continue
             
             try:
-                self._clear_node(node)
+                self._clear_node(entry.config)
             except Exception as e:
-                logger.error(f"Error clearing node {node['id']}: {str(e)}")
-                self.node_status[node['id']] = False
+                logger.error(f"Error clearing node {entry.id}: {str(e)}")
+                entry.status = False
     
     def _get_node(self, node_id: str) -> Dict[str, Any]:
         """Obtiene un nodo por su ID.
@@ -600,10 +639,10 @@ class DistributedCache(CacheBackend):
         Returns:
             Dict[str, Any]: Configuración del nodo
         """
-        for node in self.nodes:
-            if node['id'] == node_id:
-                return node
-        raise CacheError(f"Node not found: {node_id}")
+        entry = self._entries.get(node_id)
+        if entry is None:
+            raise CacheError(f"Node not found: {node_id}")
+        return entry.config
     
     def _get_required_reads(self) -> int:
         """Obtiene el número requerido de lecturas exitosas."""
@@ -715,12 +754,13 @@ class DistributedCache(CacheBackend):
             Dict[str, Any]: Estado de los nodos
         """
         health = {
-            'total_nodes': len(self.nodes),
-            'healthy_nodes': sum(1 for status in self.node_status.values() if status),
+            'total_nodes': len(self._entries),
+            'healthy_nodes': sum(1 for entry in self._entries.values() if entry.status),
             'nodes': {}
         }
         
-        for node in self.nodes:
+        for entry in self._entries.values():
+            node = entry.config
             try:
                 if node['type'] == 'redis':
                     node['client'].ping()
@@ -740,7 +780,7 @@ class DistributedCache(CacheBackend):
                     'latency_ms': latency
                 }
                 
-                self.node_status[node['id']] = status == 'healthy'
+                entry.status = status == 'healthy'
                 
             except Exception as e:
                 health['nodes'][node['id']] = {
@@ -748,7 +788,7 @@ class DistributedCache(CacheBackend):
                     'type': node['type'],
                     'error': str(e)
                 }
-                self.node_status[node['id']] = False
+                entry.status = False
         
         return health
     
@@ -761,14 +801,14 @@ class DistributedCache(CacheBackend):
         Returns:
             float: Latencia en milisegundos
         """
-        start = time.time()
+        start = time.perf_counter()
         
         if node['type'] == 'redis':
             node['client'].ping()
         elif node['type'] == 'memcached':
             node['client'].get_stats()
         
-        return (time.time() - start) * 1000  # Convertir a ms
+        return (time.perf_counter() - start) * 1000  # Convertir a ms
     
     def rebalance(self) -> bool:
         """Rebalancea la caché.
@@ -859,20 +899,19 @@ class DistributedCache(CacheBackend):
             self.cleaner.stop()
             
             # Cerrar conexiones
-            for node in self.nodes:
+            for entry in self._entries.values():
                 try:
-                    if 'client' in node:
-                        if node['type'] == 'redis':
-                            node['client'].close()
-                        elif node['type'] == 'memcached':
-                            node['client'].disconnect_all()
+                    if entry.client is not None:
+                        if entry.type == 'redis':
+                            entry.client.close()
+                        elif entry.type == 'memcached':
+                            entry.client.disconnect_all()
                 except Exception as e:
-                    logger.error(f"Error closing connection to {node['id']}: {str(e)}")
+                    logger.error(f"Error closing connection to {entry.id}: {str(e)}")
             
             # Limpiar estado interno
             self.nodes.clear()
-            self.node_status.clear()
-            self.circuit_breakers.clear()
+            self._entries.clear()
             
             logger.info("Distributed cache closed")
             
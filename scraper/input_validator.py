@@ -2,8 +2,11 @@
 
 import csv
 import logging
-from typing import List, Dict, Any, Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 from .validators import BusinessValidator, ValidationResult
@@ -11,11 +14,87 @@ from .exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+class RowError(NamedTuple):
+    """Error de validación de una fila del CSV."""
+    row: int
+    business_name: Any
+    address: Optional[Any]
+    errors: Any
+
+class ItemError(NamedTuple):
+    """Error de validación de un elemento de un lote."""
+    index: int
+    data: Dict[str, Any]
+    errors: Any
+
+def _validate_rows(
+    df: pd.DataFrame,
+    validator: Optional[BusinessValidator] = None
+) -> Tuple[List[RowError], List[Dict[str, Any]]]:
+    """Valida un bloque de filas del CSV.
+    
+    Función de módulo para poder enviarse a un ProcessPoolExecutor; los
+    números de fila se toman del índice del DataFrame, así que un bloque
+    conserva la numeración global del archivo.
+    
+    Args:
+        df: Filas a validar
+        validator: Validador a reutilizar (se crea uno si no se indica)
+        
+    Returns:
+        Tuple[List[RowError], List[Dict[str, Any]]]: Errores y advertencias
+    """
+    if validator is None:
+        validator = BusinessValidator()
+    
+    # Máscara de direcciones presentes, calculada una sola vez para el bloque
+    if 'address' in df.columns:
+        address_mask = df['address'].notna().to_numpy()
+    else:
+        address_mask = np.zeros(len(df), dtype=bool)
+    
+    errors: List[RowError] = []
+    warnings: List[Dict[str, Any]] = []
+    
+    for (idx, row), has_address in zip(df.iterrows(), address_mask):
+        try:
+            # Validar nombre de negocio
+            name_ok, name_errors = validator._validate_business_name(row['business_name'])
+            if not name_ok:
+                errors.append(RowError(idx + 1, row['business_name'], None, name_errors))
+            
+            # Validar dirección si existe
+            if has_address:
+                address_result = validator.validate({
+                    'business_name': row['business_name'],
+                    'address': row['address']
+                })
+                if not address_result.is_valid:
+                    errors.append(RowError(
+                        idx + 1, row['business_name'], row['address'],
+                        address_result.error_message
+                    ))
+                if address_result.warnings:
+                    warnings.append({
+                        'row': idx + 1,
+                        'business_name': row['business_name'],
+                        'warnings': address_result.warnings
+                    })
+        
+        except Exception as e:
+            errors.append(RowError(idx + 1, row['business_name'], None, str(e)))
+    
+    return errors, warnings
+
 class InputValidator:
     """Validador de datos de entrada."""
     
-    def __init__(self):
+    # Número mínimo de filas a partir del cual se valida en paralelo
+    PARALLEL_MIN_ROWS = 10000
+    
+    def __init__(self, max_workers: Optional[int] = None):
         self.business_validator = BusinessValidator()
+        self.max_workers = max_workers or os.cpu_count() or 1
         
     def validate_csv_file(self, file_path: str) -> ValidationResult:
         """Valida un archivo CSV de entrada.
@@ -50,53 +129,18 @@ class InputValidator:
                 )
             
             # Validar datos
-            errors = []
-            warnings = []
+            if len(df) >= self.PARALLEL_MIN_ROWS:
+                errors, warnings = self._validate_rows_parallel(df)
+            else:
+                errors, warnings = _validate_rows(df, self.business_validator)
             
-            for idx, row in df.iterrows():
-                try:
-                    # Validar nombre de negocio
-                    if not self.business_validator._validate_business_name(row['business_name']):
-                        errors.append({
-                            'row': idx + 1,
-                            'business_name': row['business_name'],
-                            'errors': self.business_validator.errors
-                        })
-                    
-                    # Validar dirección si existe
-                    if 'address' in df.columns and pd.notna(row['address']):
-                        address_result = self.business_validator.validate({
-                            'business_name': row['business_name'],
-                            'address': row['address']
-                        })
-                        if not address_result.is_valid:
-                            errors.append({
-                                'row': idx + 1,
-                                'business_name': row['business_name'],
-                                'address': row['address'],
-                                'errors': address_result.error_message
-                            })
-                        if address_result.warnings:
-                            warnings.append({
-                                'row': idx + 1,
-                                'business_name': row['business_name'],
-                                'warnings': address_result.warnings
-                            })
-                
-                except Exception as e:
-                    errors.append({
-                        'row': idx + 1,
-                        'business_name': row['business_name'],
-                        'error': str(e)
-                    })
-            
-            # Validar datos duplicados
-            duplicates = df['business_name'].duplicated()
-            if duplicates.any():
+            # Validar datos duplicados (una sola pasada sobre la máscara)
+            duplicate_rows = np.flatnonzero(df['business_name'].duplicated().to_numpy())
+            if duplicate_rows.size:
                 warnings.append({
                     'type': 'duplicates',
-                    'count': duplicates.sum(),
-                    'rows': df[duplicates].index.tolist()
+                    'count': int(duplicate_rows.size),
+                    'rows': duplicate_rows.tolist()
                 })
             
             return ValidationResult(
@@ -117,6 +161,37 @@ class InputValidator:
                 error_message=f"Error validating file: {str(e)}"
             )
     
+    def _validate_rows_parallel(
+        self,
+        df: pd.DataFrame
+    ) -> Tuple[List[RowError], List[Dict[str, Any]]]:
+        """Valida las filas repartiéndolas entre varios procesos.
+        
+        Args:
+            df: DataFrame completo
+            
+        Returns:
+            Tuple[List[RowError], List[Dict[str, Any]]]: Errores y advertencias
+        """
+        if self.max_workers <= 1:
+            return _validate_rows(df, self.business_validator)
+        
+        bounds = np.linspace(0, len(df), self.max_workers + 1, dtype=int)
+        chunks = [
+            df.iloc[start:stop]
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start
+        ]
+        
+        errors: List[RowError] = []
+        warnings: List[Dict[str, Any]] = []
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for chunk_errors, chunk_warnings in executor.map(_validate_rows, chunks):
+                errors.extend(chunk_errors)
+                warnings.extend(chunk_warnings)
+        
+        return errors, warnings
+    
     def validate_batch_data(self, data: List[Dict[str, Any]]) -> ValidationResult:
         """Valida un lote de datos.
         
@@ -126,18 +201,14 @@ class InputValidator:
         Returns:
             ValidationResult: Resultado de la validación
         """
-        errors = []
+        errors: List[ItemError] = []
         warnings = []
         
         for idx, item in enumerate(data):
             try:
                 result = self.business_validator.validate(item)
                 if not result.is_valid:
-                    errors.append({
-                        'index': idx,
-                        'data': item,
-                        'errors': result.error_message
-                    })
+                    errors.append(ItemError(idx, item, result.error_message))
                 if result.warnings:
                     warnings.append({
                         'index': idx,
@@ -145,11 +216,7 @@ class InputValidator:
                         'warnings': result.warnings
                     })
             except Exception as e:
-                errors.append({
-                    'index': idx,
-                    'data': item,
-                    'error': str(e)
-                })
+                errors.append(ItemError(idx, item, str(e)))
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -179,13 +246,27 @@ class InputValidator:
                 logger.info("No errors found to report")
                 return
             
-            # Crear DataFrame con errores
-            df = pd.DataFrame(errors)
-            
-            # Guardar reporte
-            df.to_csv(output_file, index=False)
+            # Escribir los campos de cada error directamente, sin DataFrame intermedio
+            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(self._report_header(errors[0]))
+                writer.writerows(self._report_row(error) for error in errors)
             logger.info(f"Error report saved to {output_file}")
             
         except Exception as e:
             logger.error(f"Error generating error report: {str(e)}", exc_info=True)
-            raise 
\ No newline at end of file
+            raise
+    
+    @staticmethod
+    def _report_header(error: Union[RowError, ItemError, Dict[str, Any]]) -> List[str]:
+        """Obtiene las columnas del reporte a partir del primer error."""
+        if isinstance(error, dict):
+            return list(error.keys())
+        return list(error._fields)
+    
+    @staticmethod
+    def _report_row(error: Union[RowError, ItemError, Dict[str, Any]]) -> List[Any]:
+        """Convierte un error en una fila del reporte."""
+        if isinstance(error, dict):
+            return list(error.values())
+        return list(error) 
\ No newline at end of file
@@ -1,20 +1,64 @@
 from scrapy import Item, Field
-from typing import Optional, Dict, Any, Union, ClassVar, Set
+from typing import Optional, Dict, Any, List, Union, ClassVar, FrozenSet, Protocol, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+import json
 import re
-from abc import ABC, abstractmethod
+import sys
+import time
 
-class BaseDataValidator(ABC):
-    """Clase base para validación de datos"""
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+from .constants import VALID_STATES
+
+# slots=True solo está disponible en dataclasses a partir de Python 3.10
+_DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Número JSON escrito como cadena (lo que msgspec acepta con strict=False)
+_JSON_NUMBER = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?\Z')
+
+def _lax_json_int(value: Any) -> Any:
+    """Convierte un id a int con las reglas de msgspec en modo no estricto
+    
+    Acepta números en cadena y floats con valor entero; cualquier otro valor
+    se devuelve tal cual para que lo rechace la validación de tipos.
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"id must be an integer, got {type(value)}")
+    if isinstance(value, str) and _JSON_NUMBER.match(value):
+        value = float(value) if any(c in value for c in '.eE') else int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+@lru_cache(maxsize=1)
+def _date_for_minute(minute: int) -> Tuple[date, str]:
+    """Fecha local y su forma YYYY-MM-DD, memorizadas por minuto"""
+    today = date.today()
+    return today, today.strftime('%Y-%m-%d')
+
+def _today() -> date:
+    """Fecha actual, recalculada como mucho una vez por minuto"""
+    return _date_for_minute(int(time.time() // 60))[0]
+
+def _today_iso() -> str:
+    """Fecha actual en formato YYYY-MM-DD, recalculada como mucho una vez por minuto"""
+    return _date_for_minute(int(time.time() // 60))[1]
+
+class BaseDataValidator(Protocol):
+    """Protocolo para objetos de datos que se validan a sí mismos"""
     
-    @abstractmethod
     def validate(self) -> None:
         """Validar los datos del objeto"""
-        pass
+        ...
 
-@dataclass
-class BusinessData(BaseDataValidator):
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class BusinessData:
     """Data class for business information
     
     Attributes:
@@ -31,15 +75,25 @@ class BusinessData(BaseDataValidator):
     MIN_ADDRESS_LENGTH: ClassVar[int] = 5
     MAX_ADDRESS_LENGTH: ClassVar[int] = 200
     DATE_FORMAT: ClassVar[str] = '%Y-%m-%d'
-    ZIP_CODE_PATTERN: ClassVar[re.Pattern] = re.compile(r'^\d{5}(?:-\d{4})?$')
+    _DIGITS: ClassVar[FrozenSet[str]] = frozenset('0123456789')
     REQUIRED_FIELDS: ClassVar[Set[str]] = {'id', 'business_name', 'address', 'created_at'}
+    _VALID_STATES: ClassVar[FrozenSet[str]] = frozenset(VALID_STATES)
+    # (campo, tipo, opcional, descripción); obligatorios primero
+    _FIELD_TYPES: ClassVar[Tuple[Tuple[str, type, bool, str], ...]] = (
+        ('id', int, False, 'an integer'),
+        ('business_name', str, False, 'a string'),
+        ('address', str, False, 'a string'),
+        ('created_at', str, False, 'a string'),
+        ('state', str, True, 'a string or None'),
+        ('zip_code', str, True, 'a string or None'),
+    )
 
     id: int
     business_name: str
     address: str
     state: Optional[str] = None
     zip_code: Optional[str] = None
-    created_at: str = field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d'))
+    created_at: str = field(default_factory=_today_iso)
 
     def __post_init__(self):
         """Validate types and values after initialization"""
@@ -61,18 +115,13 @@ class BusinessData(BaseDataValidator):
         Raises:
             TypeError: If any field has an invalid type
         """
-        if not isinstance(self.id, int):
-            raise TypeError(f"id must be an integer, got {type(self.id)}")
-        if not isinstance(self.business_name, str):
-            raise TypeError(f"business_name must be a string, got {type(self.business_name)}")
-        if not isinstance(self.address, str):
-            raise TypeError(f"address must be a string, got {type(self.address)}")
-        if self.state is not None and not isinstance(self.state, str):
-            raise TypeError(f"state must be a string or None, got {type(self.state)}")
-        if self.zip_code is not None and not isinstance(self.zip_code, str):
-            raise TypeError(f"zip_code must be a string or None, got {type(self.zip_code)}")
-        if not isinstance(self.created_at, str):
-            raise TypeError(f"created_at must be a string, got {type(self.created_at)}")
+        for name, expected, optional, description in self._FIELD_TYPES:
+            value = getattr(self, name)
+            if optional and value is None:
+                continue
+            # Comparación exacta de tipo primero; isinstance solo para subclases
+            if type(value) is not expected and not isinstance(value, expected):
+                raise TypeError(f"{name} must be {description}, got {type(value)}")
 
     def _validate_values(self) -> None:
         """Validate values of all fields
@@ -95,27 +144,47 @@ class BusinessData(BaseDataValidator):
                 f"address length must be between {self.MIN_ADDRESS_LENGTH} and {self.MAX_ADDRESS_LENGTH} characters"
             )
             
-        if self.state is not None:
-            if len(self.state) != 2 or not self.state.isalpha():
-                raise ValueError("state must be a two-letter code")
+        if self.state is not None and self.state not in self._VALID_STATES:
+            raise ValueError("state must be a two-letter code")
                 
         if self.zip_code is not None:
-            if not self.ZIP_CODE_PATTERN.match(self.zip_code):
+            # Equivalente a ^\d{5}(?:-\d{4})?$ con dígitos ASCII, sin motor de regex
+            zip_code = self.zip_code
+            digits = self._DIGITS
+            if not (
+                (len(zip_code) == 5 or (len(zip_code) == 10 and zip_code[5] == '-'))
+                and all(c in digits for c in zip_code[:5])
+                and all(c in digits for c in zip_code[6:])
+            ):
                 raise ValueError("zip_code must be in format XXXXX or XXXXX-XXXX")
                 
+        # Comprobación de formato por posiciones para la forma canónica
+        # YYYY-MM-DD; el resto (p. ej. '2024-1-1') pasa por strptime para
+        # aceptar exactamente las mismas fechas que DATE_FORMAT
+        created_at = self.created_at
         try:
-            date = datetime.strptime(self.created_at, self.DATE_FORMAT)
-            if date > datetime.now():
-                raise ValueError("created_at cannot be in the future")
-        except ValueError as e:
-            if "does not match format" in str(e):
-                raise ValueError(f"created_at must be in format {self.DATE_FORMAT}")
-            raise
+            if (
+                len(created_at) == 10
+                and created_at[4] == '-'
+                and created_at[7] == '-'
+                and (created_at[:4] + created_at[5:7] + created_at[8:]).isdigit()
+            ):
+                created_date = date(int(created_at[:4]), int(created_at[5:7]), int(created_at[8:]))
+            else:
+                created_date = datetime.strptime(created_at, self.DATE_FORMAT).date()
+        except ValueError:
+            raise ValueError(f"created_at must be in format {self.DATE_FORMAT}")
+        if created_date > _today():
+            raise ValueError("created_at cannot be in the future")
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BusinessData':
         """Create BusinessData from dictionary
         
+        Identical rows (retries, overlapping pages) return a shared instance
+        from an LRU cache instead of being validated again; this is safe
+        because instances are frozen.
+        
         Args:
             data: Dictionary containing business data
             
@@ -133,7 +202,78 @@ class BusinessData(BaseDataValidator):
 
         # Limpieza y conversión de datos
         cleaned_data = cls._clean_data(data)
-        return cls(**cleaned_data)
+        if cls is not BusinessData:
+            return cls(**cleaned_data)
+        
+        key = tuple(sorted(cleaned_data.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # Valores no hashables: construir sin caché
+            return cls(**cleaned_data)
+        return _build_business_data(key)
+
+    @classmethod
+    def from_json(cls, buf: Union[bytes, str]) -> 'BusinessData':
+        """Create BusinessData directly from a JSON object
+        
+        With msgspec installed, JSON parsing, type coercion and validation
+        run in a single decoder pass without an intermediate dict. Unlike
+        from_dict, values are not stripped or upper-cased.
+        
+        Args:
+            buf: JSON document with the business fields
+            
+        Returns:
+            BusinessData: New validated instance
+            
+        Raises:
+            ValueError: If the JSON is malformed or the data is invalid
+        """
+        if MSGSPEC_AVAILABLE and cls is BusinessData:
+            return _JSON_DECODER.decode(buf)
+        return cls._from_json_object(json.loads(buf))
+
+    @classmethod
+    def from_json_lines(cls, buf: Union[bytes, str]) -> List['BusinessData']:
+        """Create BusinessData instances from a JSON Lines buffer
+        
+        Args:
+            buf: One JSON object per line
+            
+        Returns:
+            List[BusinessData]: Validated instances, in input order
+            
+        Raises:
+            ValueError: If any line is malformed or contains invalid data
+        """
+        if MSGSPEC_AVAILABLE and cls is BusinessData:
+            return _JSON_DECODER.decode_lines(buf)
+        if isinstance(buf, bytes):
+            buf = buf.decode('utf-8')
+        return [
+            cls._from_json_object(json.loads(line))
+            for line in buf.splitlines()
+            if line.strip()
+        ]
+
+    @classmethod
+    def _from_json_object(cls, data: Any) -> 'BusinessData':
+        """Build an instance from a decoded JSON object (fallback without msgspec)
+        
+        Follows the msgspec decoder rules: unknown keys are ignored and the
+        id accepts numbers written as strings.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+        fields = {name: data[name] for name, *_ in cls._FIELD_TYPES if name in data}
+        if 'id' in fields:
+            fields['id'] = _lax_json_int(fields['id'])
+        try:
+            return cls(**fields)
+        except TypeError as e:
+            # Mismo tipo de error que el decodificador de msgspec
+            raise ValueError(str(e)) from e
 
     @classmethod
     def _clean_data(cls, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -188,6 +328,16 @@ class BusinessData(BaseDataValidator):
             f"created='{self.created_at}')"
         )
 
+if MSGSPEC_AVAILABLE:
+    # strict=False permite ids numéricos como cadena, igual que from_dict y
+    # que _from_json_object; las claves desconocidas se ignoran en ambos
+    _JSON_DECODER = msgspec.json.Decoder(BusinessData, strict=False)
+
+@lru_cache(maxsize=4096)
+def _build_business_data(key: Tuple[Tuple[str, Any], ...]) -> BusinessData:
+    """Construye (y memoriza) un BusinessData a partir de sus campos ordenados"""
+    return BusinessData(**dict(key))
+
 class BusinessItem(Item):
     """Define the structure of scraped business data
     
@@ -219,26 +369,24 @@ class BusinessItem(Item):
             BusinessItem: New item with data from BusinessData
             
         Raises:
-            ValueError: If required fields are missing or invalid
             TypeError: If data is not a BusinessData instance
         """
         if not isinstance(data, BusinessData):
             raise TypeError("Data must be an instance of BusinessData")
             
-        item = cls()
+        # BusinessData ya garantiza que los campos obligatorios son válidos
+        item = cls(
+            id=data.id,
+            business_name=data.business_name,
+            address=data.address,
+            created_at=data.created_at
+        )
         
-        # Validate required fields
-        missing_fields = cls.REQUIRED_FIELDS - set(data.__dataclass_fields__)
-        if missing_fields:
-            raise ValueError(f"Missing required fields: {missing_fields}")
-            
-        # Copy all fields
-        for field in data.__dataclass_fields__:
-            value = getattr(data, field)
-            if field in cls.REQUIRED_FIELDS and not value:
-                raise ValueError(f"Required field '{field}' cannot be empty")
-            if value is not None:  # Solo copiar campos con valor
-                item[field] = value
+        # Solo copiar campos opcionales con valor
+        if data.state is not None:
+            item['state'] = data.state
+        if data.zip_code is not None:
+            item['zip_code'] = data.zip_code
             
         return item
 
@@ -1,18 +1,177 @@
 import logging
-from typing import List, Dict, Optional, Any, Union, TypeVar, Tuple
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, NamedTuple, Union, TypeVar, Tuple
 import os
+import re
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from .exceptions import LLaMAError
 
-try:
-    from llama_cpp import Llama
-    LLAMA_AVAILABLE = True
-except ImportError:
-    LLAMA_AVAILABLE = False
+if TYPE_CHECKING:
+    from llama_cpp import Llama, LlamaGrammar
+
+# llama_cpp carga una extensión nativa pesada: se importa solo cuando se va a
+# cargar un modelo (ver _import_llama). None indica que aún no se ha intentado.
+llama_cpp = None
+LLAMA_AVAILABLE: Optional[bool] = None
+
+def _import_llama() -> bool:
+    """Importa llama_cpp la primera vez que se necesita.
+
+    Returns:
+        bool: True si llama-cpp-python está disponible
+    """
+    global llama_cpp, LLAMA_AVAILABLE
+    if LLAMA_AVAILABLE is None:
+        try:
+            import llama_cpp as module
+            llama_cpp = module
+            LLAMA_AVAILABLE = True
+        except ImportError:
+            LLAMA_AVAILABLE = False
+    return LLAMA_AVAILABLE
 
 T = TypeVar('T')
 
+# Plantillas de prompt: la parte estática va primero y la variable al final,
+# de modo que llama.cpp reutiliza el KV cache del prefijo común entre
+# llamadas consecutivas y solo evalúa los tokens nuevos.
+SEARCH_PROMPT_PREFIX = """<task>Generate an optimized search query for finding business information.</task>
+<requirements>
+- Include terms for finding official business records
+- Focus on physical location and registration info
+- Target New York state businesses
+- Include relevant industry keywords
+- Consider business type and scale
+</requirements>
+<format>Return only the search query without any additional text.</format>
+"""
+SEARCH_PROMPT_SUFFIX = """<business>{business_name}</business>
+<query>"""
+
+RELEVANCE_PROMPT_PREFIX = """<task>Analyze this search result and rate its relevance for finding business information.</task>
+<format>Return only a number between 0 and 1 representing relevance score.</format>
+"""
+RELEVANCE_PROMPT_SUFFIX = """<result>
+Title: {title}
+Description: {description}
+URL: {url}
+</result>
+<score>"""
+
+# Puntuación por lotes: varios resultados en un mismo prompt, con una
+# puntuación por resultado separada por comas en la respuesta
+RELEVANCE_BATCH_PROMPT_PREFIX = """<task>Analyze these search results and rate the relevance of each one for finding business information.</task>
+<format>Return only one number between 0 and 1 per result, in the same order, separated by commas.</format>
+"""
+RELEVANCE_BATCH_ITEM = """<result id="{index}">
+Title: {title}
+Description: {description}
+URL: {url}
+</result>
+"""
+RELEVANCE_BATCH_PROMPT_SUFFIX = "<scores>"
+
+# Gramática GBNF para la puntuación: fuerza un número entre 0 y 1 con hasta
+# tres decimales, sin muestrear tokens que luego no se podrían interpretar
+SCORE_GRAMMAR = r"""
+root ::= "0" frac? | "1" ("." "0" "0"? "0"?)?
+frac ::= "." [0-9] [0-9]? [0-9]?
+"""
+
+# Gramática de una lista de puntuaciones; la regla raíz se genera según el
+# tamaño del lote para exigir exactamente una puntuación por resultado
+SCORE_LIST_GRAMMAR_RULES = r"""
+score ::= "0" frac? | "1" ("." "0" "0"? "0"?)?
+frac ::= "." [0-9] [0-9]? [0-9]?
+sep ::= "," " "?
+"""
+
+@lru_cache(maxsize=8)
+def _score_list_grammar(count: int) -> 'LlamaGrammar':
+    """Compila (y memoriza) la gramática para un lote de `count` puntuaciones."""
+    root = 'root ::= score' + ' sep score' * (count - 1)
+    return llama_cpp.LlamaGrammar.from_string(root + SCORE_LIST_GRAMMAR_RULES, verbose=False)
+
+# Tipos de fichero GGUF (general.file_type) de las cuantizaciones recomendadas
+RECOMMENDED_FILE_TYPES = {
+    '15': 'Q4_K_M',
+    '17': 'Q5_K_M'
+}
+
+# Normalización de respuestas del modelo
+_WHITESPACE_RE = re.compile(r"\s+")
+_QUOTED_RE = re.compile(r'^"(.*)"$')
+_KEY_TERMS_RE = re.compile(r"business|company|address|location", re.IGNORECASE)
+
+# Términos para la puntuación básica de resultados
+FALLBACK_KEYWORDS = (
+    "address", "location", "business", "new york", "ny", "official",
+    "contact", "headquarters", "office", "store"
+)
+TRUSTED_RESULT_DOMAINS = ("ny.gov", "nyc.gov", "bbb.org", "chamberofcommerce.com")
+TITLE_BONUS_TERMS = ("address", "location", "contact")
+
+# Clave de ordenación de los resultados puntuados
+_RELEVANCE_KEY = itemgetter("relevance_score")
+
+class _TermMatcher:
+    """Busca varios términos a la vez con una única expresión regular precompilada."""
+    
+    def __init__(self, terms: Tuple[str, ...]):
+        self.terms = terms
+        alternation = '|'.join(map(re.escape, sorted(terms, key=len, reverse=True)))
+        self._any_pattern = re.compile(alternation)
+        # El lookahead encuentra coincidencias solapadas, pero solo una por posición:
+        # si un término es prefijo de otro no se pueden contar ambos de esta forma.
+        if any(a != b and b.startswith(a) for a in terms for b in terms):
+            self._all_pattern = None
+        else:
+            self._all_pattern = re.compile(f'(?=({alternation}))')
+    
+    def count(self, text: str) -> int:
+        """Número de términos distintos presentes en el texto."""
+        if self._all_pattern is None:
+            return sum(1 for term in self.terms if term in text)
+        return len(set(self._all_pattern.findall(text)))
+    
+    def search(self, text: str) -> bool:
+        """Indica si algún término aparece en el texto."""
+        return self._any_pattern.search(text) is not None
+
+@lru_cache(maxsize=32)
+def _term_matcher(terms: Tuple[str, ...]) -> _TermMatcher:
+    """Obtiene (y memoriza) el buscador compilado para un conjunto de términos."""
+    return _TermMatcher(terms)
+
+# Compilados al importar el módulo para no pagar la compilación en la primera puntuación
+_DOMAIN_MATCHER = _term_matcher(TRUSTED_RESULT_DOMAINS)
+_TITLE_MATCHER = _term_matcher(TITLE_BONUS_TERMS)
+_term_matcher(FALLBACK_KEYWORDS)
+
+def _lower(value: Any) -> Any:
+    """Pasa a minúsculas los textos; otros valores se dejan tal cual."""
+    return value.lower() if isinstance(value, str) else value
+
+class _ResultColumns(NamedTuple):
+    """Resultados de búsqueda como columnas paralelas, una lista por campo.
+
+    Los textos se guardan ya en minúsculas para no repetir lower() en cada
+    comparación.
+    """
+    titles: List[Any]
+    descriptions: List[Any]
+    urls: List[Any]
+
+    @classmethod
+    def from_results(cls, results: List[Dict[str, Any]]) -> '_ResultColumns':
+        """Extrae los campos usados en la puntuación en una sola pasada por campo."""
+        return cls(
+            [_lower(result.get('title', '')) for result in results],
+            [_lower(result.get('description', '')) for result in results],
+            [_lower(result.get('url', '')) for result in results]
+        )
+
 @dataclass
 class LlamaResponse:
     """Estructura de datos para respuestas del modelo LLaMA."""
@@ -28,6 +187,12 @@ class LlamaProcessor:
     MAX_RETRIES = 3
     MAX_THREADS = 4
     DEFAULT_TIMEOUT = 30
+    # Los prompts usados ocupan unos 300 tokens con la respuesta incluida
+    CONTEXT_SIZE = 512
+    # Resultados por prompt de puntuación y longitud máxima de la descripción
+    # en cualquier prompt de puntuación, acotados para que quepan en CONTEXT_SIZE
+    RELEVANCE_BATCH_SIZE = 3
+    DESCRIPTION_CHARS = 300
     
     def __init__(self, model_path: Optional[str] = None):
         """Inicializa el procesador LLaMA.
@@ -37,8 +202,8 @@ class LlamaProcessor:
         """
         self.logger = logging.getLogger(__name__)
         self.model = None
+        self._score_grammar = None
         self.is_enabled = os.getenv('ENABLE_AI_FEATURES', 'false').lower() == 'true'
-        self._executor = ThreadPoolExecutor(max_workers=self.MAX_THREADS)
         
         if self.is_enabled:
             self.model = self._load_model(model_path)
@@ -67,9 +232,9 @@ class LlamaProcessor:
             self.logger.error(f"Error executing {func.__name__}: {str(e)}", exc_info=True)
             return False, None, str(e)
 
-    def _load_model(self, model_path: Optional[str] = None) -> Optional[Llama]:
+    def _load_model(self, model_path: Optional[str] = None) -> Optional['Llama']:
         """Carga el modelo LLaMA con manejo mejorado de errores."""
-        if not LLAMA_AVAILABLE:
+        if not _import_llama():
             self.logger.warning("llama-cpp-python not available, using fallback mode")
             return None
 
@@ -81,17 +246,58 @@ class LlamaProcessor:
                 raise LLaMAError("Model path not found or invalid")
 
             n_threads = min(os.cpu_count() or 1, self.MAX_THREADS)
+            n_ctx = int(os.getenv("LLAMA_N_CTX", self.CONTEXT_SIZE))
+            n_gpu_layers = self._get_gpu_layers()
             
-            return Llama(
+            model = llama_cpp.Llama(
                 model_path=model_path,
-                n_ctx=2048,
+                n_ctx=n_ctx,
                 n_threads=n_threads,
-                n_batch=512,
+                n_batch=min(512, n_ctx),
+                use_mmap=True,
+                use_mlock=False,
+                logits_all=False,
+                n_gpu_layers=n_gpu_layers,
                 verbose=False
             )
+            self._check_quantization(model, model_path)
+            self._score_grammar = llama_cpp.LlamaGrammar.from_string(SCORE_GRAMMAR, verbose=False)
+            return model
         except Exception as e:
             raise LLaMAError(f"Error loading model: {str(e)}")
 
+    def _get_gpu_layers(self) -> int:
+        """Número de capas a descargar en GPU (CUDA/HIP/Metal).
+        
+        Por defecto todas (-1) si llama.cpp se compiló con soporte de GPU y
+        ninguna en caso contrario; LLAMA_GPU_LAYERS permite ajustarlo.
+        """
+        configured = os.getenv("LLAMA_GPU_LAYERS")
+        if configured:
+            return int(configured)
+        
+        supports_gpu = getattr(llama_cpp, "llama_supports_gpu_offload", None)
+        try:
+            if supports_gpu is not None and supports_gpu():
+                self.logger.info("GPU offload available, loading all layers on GPU")
+                return -1
+        except Exception as e:
+            self.logger.warning(f"Could not detect GPU offload support: {str(e)}")
+        return 0
+
+    def _check_quantization(self, model: 'Llama', model_path: str) -> None:
+        """Avisa si el modelo no usa una cuantización Q4_K_M/Q5_K_M."""
+        metadata = getattr(model, "metadata", None) or {}
+        file_type = metadata.get("general.file_type")
+        if file_type is None:
+            return
+        if str(file_type) not in RECOMMENDED_FILE_TYPES:
+            self.logger.warning(
+                f"Model {os.path.basename(model_path)} has GGUF file type {file_type}; "
+                f"a {'/'.join(RECOMMENDED_FILE_TYPES.values())} quantization is recommended "
+                f"for lower memory bandwidth and faster inference"
+            )
+
     def enhance_query(self, business_name: str) -> LlamaResponse:
         """Mejora la consulta de búsqueda usando el modelo LLaMA."""
         if not self.is_enabled or not self.model:
@@ -133,31 +339,22 @@ class LlamaProcessor:
 
     def _create_search_prompt(self, business_name: str) -> str:
         """Crea un prompt estructurado para el modelo LLaMA."""
-        return f"""<task>Generate an optimized search query for finding business information.</task>
-<business>{business_name}</business>
-<requirements>
-- Include terms for finding official business records
-- Focus on physical location and registration info
-- Target New York state businesses
-- Include relevant industry keywords
-- Consider business type and scale
-</requirements>
-<format>Return only the search query without any additional text.</format>
-<query>"""
+        return SEARCH_PROMPT_PREFIX + SEARCH_PROMPT_SUFFIX.format(business_name=business_name)
 
     def _parse_llama_response(self, response: str) -> str:
         """Procesa y valida la respuesta del modelo."""
         try:
-            clean_response = " ".join(response.strip().split())
+            clean_response = _WHITESPACE_RE.sub(" ", response.strip())
             
-            if clean_response.startswith('"') and clean_response.endswith('"'):
-                clean_response = clean_response[1:-1].strip()
+            quoted = _QUOTED_RE.match(clean_response)
+            if quoted:
+                clean_response = quoted.group(1).strip()
             
             if len(clean_response) < 5:
                 raise ValueError("Response too short")
             
             # Validación adicional de la respuesta
-            if not any(word in clean_response.lower() for word in ["business", "company", "address", "location"]):
+            if not _KEY_TERMS_RE.search(clean_response):
                 raise ValueError("Response missing key business terms")
                 
             return clean_response
@@ -191,42 +388,95 @@ class LlamaProcessor:
         )
 
     def analyze_search_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Analyze and score search results."""
+        """Analyze and score search results.
+
+        Los resultados se puntúan en el propio diccionario de cada uno, sin copiarlos.
+        """
         if not self.is_enabled or not self.model:
             return self._fallback_analyze_results(results)
 
         try:
             scored_results = []
-            for result in results:
-                score = self._calculate_llama_relevance(result)
-                scored_results.append({
-                    **result,
-                    "relevance_score": score.score,
-                    "ai_analysis": score.content
-                })
-
-            return sorted(scored_results, key=lambda x: x["relevance_score"], reverse=True)
+            scores = self._calculate_llama_relevance_batch(results)
+            for result, score in zip(results, scores):
+                result["relevance_score"] = score.score
+                result["ai_analysis"] = score.content
+                scored_results.append(result)
+
+            scored_results.sort(key=_RELEVANCE_KEY, reverse=True)
+            return scored_results
         except Exception as e:
             self.logger.error(f"Error analyzing results with LLaMA: {e}", exc_info=True)
             return self._fallback_analyze_results(results)
 
+    def _calculate_llama_relevance_batch(
+        self,
+        results: List[Dict[str, Any]]
+    ) -> List[LlamaResponse]:
+        """Calcula la relevancia de varios resultados con una inferencia por lote.
+        
+        Args:
+            results: Resultados de búsqueda
+            
+        Returns:
+            List[LlamaResponse]: Una puntuación por resultado, en el mismo orden
+        """
+        scores: List[LlamaResponse] = []
+        for start in range(0, len(results), self.RELEVANCE_BATCH_SIZE):
+            scores.extend(self._score_batch(results[start:start + self.RELEVANCE_BATCH_SIZE]))
+        return scores
+
+    def _score_batch(self, batch: List[Dict[str, Any]]) -> List[LlamaResponse]:
+        """Puntúa un lote en un único prompt; si falla, puntúa cada resultado por separado."""
+        if len(batch) == 1:
+            return [self._calculate_llama_relevance(batch[0])]
+
+        try:
+            prompt = RELEVANCE_BATCH_PROMPT_PREFIX + ''.join(
+                RELEVANCE_BATCH_ITEM.format(
+                    index=index,
+                    title=result.get('title', ''),
+                    description=str(result.get('description', ''))[:self.DESCRIPTION_CHARS],
+                    url=result.get('url', '')
+                )
+                for index, result in enumerate(batch, 1)
+            ) + RELEVANCE_BATCH_PROMPT_SUFFIX
+
+            response = self.model(
+                prompt,
+                max_tokens=8 * len(batch),
+                temperature=0.3,
+                stop=["</scores>", "\n"],
+                grammar=_score_list_grammar(len(batch)) if self._score_grammar else None
+            )
+
+            values = [float(value) for value in response["choices"][0]["text"].split(",")]
+            if len(values) != len(batch):
+                raise ValueError(f"Expected {len(batch)} scores, got {len(values)}")
+
+            return [
+                LlamaResponse(success=True, content=str(score), score=score)
+                for score in (min(max(value, 0), 1) for value in values)
+            ]
+        except Exception as e:
+            self.logger.warning(f"Batch relevance scoring failed, scoring individually: {e}")
+            return [self._calculate_llama_relevance(result) for result in batch]
+
     def _calculate_llama_relevance(self, result: Dict[str, Any]) -> LlamaResponse:
         """Calculate relevance score using LLaMA model."""
         try:
-            prompt = f"""<task>Analyze this search result and rate its relevance for finding business information.</task>
-<result>
-Title: {result.get('title', '')}
-Description: {result.get('description', '')}
-URL: {result.get('url', '')}
-</result>
-<format>Return only a number between 0 and 1 representing relevance score.</format>
-<score>"""
+            prompt = RELEVANCE_PROMPT_PREFIX + RELEVANCE_PROMPT_SUFFIX.format(
+                title=result.get('title', ''),
+                description=str(result.get('description', ''))[:self.DESCRIPTION_CHARS],
+                url=result.get('url', '')
+            )
 
             response = self.model(
                 prompt,
-                max_tokens=50,
+                max_tokens=8,
                 temperature=0.3,
-                stop=["</score>", "\n"]
+                stop=["</score>", "\n"],
+                grammar=self._score_grammar
             )
 
             score_text = response["choices"][0]["text"].strip()
@@ -257,46 +507,63 @@ URL: {result.get('url', '')}
     def _fallback_analyze_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Basic analysis of search results when LLaMA is not available."""
         try:
-            scored_results = []
-            keywords = [
-                "address", "location", "business", "new york", "ny", "official",
-                "contact", "headquarters", "office", "store"
-            ]
+            scores = self._score_results(_ResultColumns.from_results(results), FALLBACK_KEYWORDS)
+            # sorted(..., reverse=True) es estable: los empates conservan su orden
+            order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
 
-            for result in results:
-                score = self._calculate_basic_relevance(result, keywords)
-                scored_results.append({
-                    **result,
-                    "relevance_score": score,
-                    "ai_analysis": "Fallback scoring used"
-                })
+            for result, score in zip(results, scores):
+                result["relevance_score"] = score
+                result["ai_analysis"] = "Fallback scoring used"
 
-            return sorted(scored_results, key=lambda x: x["relevance_score"], reverse=True)
+            return [results[i] for i in order]
         except Exception as e:
             self.logger.error(f"Error in fallback analysis: {e}", exc_info=True)
             return results
 
     def _calculate_basic_relevance(self, result: Dict[str, Any], keywords: List[str]) -> float:
         """Calculate basic relevance score based on keyword presence."""
-        try:
-            text = f"{result.get('title', '')} {result.get('description', '')}".lower()
-            url = result.get('url', '').lower()
+        return self._score_row(
+            _term_matcher(tuple(keywords)),
+            len(keywords),
+            _lower(result.get('title', '')),
+            _lower(result.get('description', '')),
+            _lower(result.get('url', ''))
+        )
 
-            # Puntuación base por coincidencias de palabras clave
-            keyword_matches = sum(1 for keyword in keywords if keyword in text)
-            base_score = min(keyword_matches / len(keywords), 1.0)
+    def _score_results(self, columns: '_ResultColumns', keywords: List[str]) -> List[float]:
+        """Calcula la relevancia básica de todos los resultados.
 
-            # Bonus por URLs confiables
-            trusted_domains = ["ny.gov", "nyc.gov", "bbb.org", "chamberofcommerce.com"]
-            domain_bonus = 0.2 if any(domain in url for domain in trusted_domains) else 0
+        Args:
+            columns: Resultados en columnas paralelas
+            keywords: Palabras clave a buscar en título y descripción
 
-            # Bonus por términos específicos en el título
-            title = result.get('title', '').lower()
-            title_bonus = 0.1 if any(term in title for term in ["address", "location", "contact"]) else 0
+        Returns:
+            List[float]: Puntuación entre 0 y 1 por resultado (0.5 si falló)
+        """
+        keyword_matcher = _term_matcher(tuple(keywords))
+        return [
+            self._score_row(keyword_matcher, len(keywords), title, description, url)
+            for title, description, url in zip(*columns)
+        ]
+
+    def _score_row(
+        self,
+        keyword_matcher: _TermMatcher,
+        keyword_count: int,
+        title: Any,
+        description: Any,
+        url: Any
+    ) -> float:
+        """Puntúa un resultado a partir de sus campos ya en minúsculas."""
+        try:
+            # Puntuación base por coincidencias de palabras clave
+            base_score = min(keyword_matcher.count(f"{title} {description}") / keyword_count, 1.0)
 
-            final_score = min(base_score + domain_bonus + title_bonus, 1.0)
-            return round(final_score, 2)
+            # Bonus por URLs confiables y por términos específicos en el título
+            domain_bonus = 0.2 if _DOMAIN_MATCHER.search(url) else 0
+            title_bonus = 0.1 if _TITLE_MATCHER.search(title) else 0
 
+            return round(min(base_score + domain_bonus + title_bonus, 1.0), 2)
         except Exception as e:
             self.logger.warning(f"Error in basic relevance calculation: {e}")
             return 0.5
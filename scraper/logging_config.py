@@ -1,19 +1,101 @@
 """Configuración del sistema de logging para el scraper."""
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
-from datetime import datetime
+import queue
+import re
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, Union, List
+from typing import Optional, Dict, Any, Set, Union, List
 import json
 import gzip
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from operator import attrgetter
 
 from .settings import Settings
 
-class JsonFormatter(logging.Formatter):
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Listener en segundo plano que escribe los registros encolados por setup_logging
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+# Directorios de logs ya creados en este proceso
+_ENSURED_DIRS: Set[str] = set()
+_ENSURED_DIRS_LOCK = threading.Lock()
+
+def _ensure_dir(path: Path) -> None:
+    """Crea un directorio de logs una sola vez por proceso.
+    
+    Args:
+        path: Directorio a crear
+    """
+    key = str(path)
+    if key in _ENSURED_DIRS:
+        return
+    with _ENSURED_DIRS_LOCK:
+        if key not in _ENSURED_DIRS:
+            path.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(key)
+
+# Atributos estándar de LogRecord (y los que añade Formatter); el resto de
+# atributos de un registro son campos extra pasados por el llamante
+_LOG_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord('', 0, '', 0, '', (), None))
+) | {'message', 'asctime', 'metadata'}
+
+# Valores admitidos por validate_log_config
+_VALID_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+_VALID_ROTATIONS = frozenset({'daily', 'size'})
+
+class CachedTimeMixin:
+    """Reutiliza la parte de fecha y hora de asctime dentro del mismo segundo.
+    
+    Los registros llegan en ráfagas con el mismo segundo, así que strftime
+    solo se ejecuta cuando cambia; los milisegundos se añaden por registro.
+    La caché es una tupla que se sustituye de una vez, por lo que un mismo
+    formateador puede usarse desde varios hilos.
+    """
+    
+    _time_cache = (None, None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Formatea la hora del registro.
+        
+        Args:
+            record: Registro a formatear
+            datefmt: Formato de fecha (por defecto el de logging.Formatter)
+            
+        Returns:
+            str: Fecha y hora formateadas
+        """
+        second = int(record.created)
+        cached_second, cached_datefmt, text = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._time_cache = (second, datefmt, text)
+        if datefmt or not self.default_msec_format:
+            return text
+        return self.default_msec_format % (text, record.msecs)
+
+class JsonFormatter(CachedTimeMixin, logging.Formatter):
     """Formateador de logs en formato JSON."""
     
     def __init__(self, include_extra_fields: bool = True):
@@ -30,6 +112,16 @@ class JsonFormatter(logging.Formatter):
             'name': '%(name)s',
             'message': '%(message)s'
         }
+        # Codificador compacto reutilizado (orjson si está disponible); lo no
+        # serializable se convierte a texto
+        if ORJSON_AVAILABLE:
+            self._encode = self._orjson_encode
+        else:
+            self._encode = json.JSONEncoder(
+                separators=(',', ':'),
+                ensure_ascii=False,
+                default=str
+            ).encode
         
     def format(self, record: logging.LogRecord) -> str:
         """Formatea el registro en JSON.
@@ -49,26 +141,154 @@ class JsonFormatter(logging.Formatter):
         
         if self.include_extra_fields:
             # Incluir campos extra
-            if hasattr(record, 'metadata'):
-                message['metadata'] = record.metadata
+            record_fields = record.__dict__
+            if 'metadata' in record_fields:
+                message['metadata'] = record_fields['metadata']
             
             if record.exc_info:
                 message['exception'] = self.formatException(record.exc_info)
             
-            # Incluir campos del registro
-            for key, value in record.__dict__.items():
-                if (
-                    key not in ['timestamp', 'level', 'name', 'message', 'metadata']
-                    and not key.startswith('_')
-                    and isinstance(value, (str, int, float, bool, dict, list))
-                ):
+            # Incluir los campos extra del registro (no los atributos estándar)
+            for key, value in record_fields.items():
+                if key not in _LOG_RECORD_ATTRS and not key.startswith('_'):
                     message[key] = value
         
-        return json.dumps(message)
+        return self._encode(message)
+    
+    @staticmethod
+    def _orjson_encode(message: Dict[str, Any]) -> str:
+        """Serializa el registro con orjson."""
+        return orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+class FastFormatter(CachedTimeMixin, logging.Formatter):
+    """Formateador de texto con la plantilla compilada una sola vez.
+    
+    Una plantilla %-style con campos simples (%(name)s) se convierte al crear
+    el formateador en una plantilla de str.format y un attrgetter con los
+    campos, en lugar de interpretarse en cada registro. Las plantillas con
+    otros especificadores (%(lineno)d, %(msecs)03d...) usan el formateo
+    estándar.
+    """
+    
+    _FIELD_RE = re.compile(r'%\((\w+)\)s')
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        """Inicializa el formateador.
+        
+        Args:
+            fmt: Plantilla %-style
+            datefmt: Formato de fecha
+        """
+        super().__init__(fmt, datefmt)
+        self._template: Optional[str] = None
+        
+        fields = self._FIELD_RE.findall(self._fmt)
+        remainder = self._FIELD_RE.sub('', self._fmt).replace('%%', '')
+        if fields and '%' not in remainder:
+            template = self._fmt.replace('{', '{{').replace('}', '}}')
+            template = self._FIELD_RE.sub('{}', template).replace('%%', '%')
+            getter = attrgetter(*fields)
+            # attrgetter devuelve el valor directamente si solo hay un campo
+            self._values = getter if len(fields) > 1 else (lambda record: (getter(record),))
+            self._template = template
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Aplica la plantilla compilada al registro.
+        
+        Args:
+            record: Registro con message (y asctime) ya calculados
+            
+        Returns:
+            str: Registro formateado
+        """
+        if self._template is None:
+            return super().formatMessage(record)
+        return self._template.format(*self._values(record))
+
+class SharedFormatter(logging.Formatter):
+    """Comparte el texto formateado de un registro entre varios handlers.
+    
+    El QueueListener entrega el mismo registro a cada handler, uno tras otro
+    y desde un único hilo: el primero lo formatea con el formateador envuelto
+    y los siguientes reutilizan el resultado.
+    """
+    
+    def __init__(self, formatter: logging.Formatter):
+        """Inicializa el formateador.
+        
+        Args:
+            formatter: Formateador que produce el texto
+        """
+        super().__init__()
+        self._formatter = formatter
+        self._record: Optional[logging.LogRecord] = None
+        self._text = ''
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Formatea el registro solo si es distinto del último.
+        
+        Args:
+            record: Registro a formatear
+            
+        Returns:
+            str: Registro formateado
+        """
+        if record is not self._record:
+            self._text = self._formatter.format(record)
+            self._record = record
+        return self._text
 
-class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+class BufferedFileMixin:
+    """Escritura con buffer para handlers de archivo.
+    
+    StreamHandler vacía el stream tras cada registro, lo que supone una
+    llamada write() al sistema por línea. Con este mixin el archivo se abre
+    con un buffer de BUFFER_SIZE bytes y solo se vacía al llenarse, al
+    cerrar el handler o al emitir un registro ERROR o superior.
+    """
+    
+    BUFFER_SIZE = 65536
+    
+    _buffered = False
+    
+    def _open(self):
+        """Abre el archivo de log con un buffer amplio."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=getattr(self, 'errors', None)
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Escribe el registro; solo los errores fuerzan el vaciado del buffer."""
+        self._buffered = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._buffered = False
+    
+    def flush(self) -> None:
+        """Vacía el buffer salvo durante la emisión de registros no críticos."""
+        if not self._buffered:
+            super().flush()
+
+class BufferedFileHandler(BufferedFileMixin, logging.FileHandler):
+    """FileHandler con escritura en buffer."""
+
+class CompressedRotatingFileHandler(BufferedFileMixin, logging.handlers.RotatingFileHandler):
     """Handler que comprime los archivos rotados."""
     
+    # Un único hilo compartido comprime los archivos rotados en orden
+    _rotation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='log-rotation')
+    
+    # Buffers de copia y de archivo, y niveles de compresión (priorizan velocidad)
+    COPY_BUFFER_SIZE = 8 * 1024 * 1024
+    FILE_BUFFER_SIZE = 1 << 20
+    COMPRESS_LEVEL = 1
+    ZSTD_LEVEL = 3
+    
     def __init__(
         self,
         filename: Union[str, Path],
@@ -91,7 +311,10 @@ class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
             errors: Manejo de errores de codificación
         """
         # Asegurar que el directorio existe
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(Path(filename).parent)
+        
+        # zstd comprime bastante más rápido que gzip con un ratio similar
+        self._codec = 'zstd' if ZSTD_AVAILABLE else 'gzip'
         
         super().__init__(
             filename,
@@ -103,6 +326,39 @@ class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
             errors
         )
     
+    def _open(self):
+        """Abre el archivo y toma su tamaño actual como punto de partida."""
+        stream = super()._open()
+        self._stream_size = stream.tell()
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Escribe el registro, rotando antes si no cabe en el archivo actual.
+        
+        RotatingFileHandler comprueba el tamaño con seek() en cada registro, lo
+        que vaciaría el buffer; aquí el tamaño escrito se lleva en un contador
+        y el registro se formatea una sola vez.
+        
+        Args:
+            record: Registro a escribir
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._stream_size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._stream_size += len(msg)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
     def rotation_filename(self, default_name: str) -> str:
         """Genera nombre para archivo rotado.
         
@@ -112,7 +368,71 @@ class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
         Returns:
             str: Nombre del archivo
         """
-        return f"{default_name}.gz"
+        return f"{default_name}.zst" if self._codec == 'zstd' else f"{default_name}.gz"
+    
+    def doRollover(self) -> None:
+        """Rota el archivo actual sin bloquear la escritura de logs.
+        
+        El archivo se renombra con una marca de tiempo (un único os.replace,
+        sea cual sea backupCount) para poder abrir uno nuevo; la compresión y
+        la eliminación de backups sobrantes se encolan en _rotation_executor,
+        cuyo único hilo las ejecuta en orden.
+        """
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        
+        if self.backupCount > 0 and os.path.exists(self.baseFilename):
+            try:
+                rotated = f"{self.baseFilename}.{time.time_ns()}"
+                os.replace(self.baseFilename, rotated)
+                self._rotation_executor.submit(self._compress_backup, rotated)
+            except Exception as e:
+                logging.error(f"Error rotating log file: {str(e)}")
+        
+        if not self.delay:
+            self.stream = self._open()
+    
+    def _compress_backup(self, rotated: str) -> None:
+        """Comprime un archivo rotado y elimina los backups que sobran.
+        
+        Args:
+            rotated: Archivo renombrado por doRollover
+        """
+        # Puede haberlo eliminado ya _prune_backups si había rotaciones en cola
+        if os.path.exists(rotated):
+            self.rotate(rotated, self.rotation_filename(rotated))
+        self._prune_backups()
+    
+    def _prune_backups(self) -> None:
+        """Conserva solo los backupCount backups más recientes.
+        
+        Cuentan tanto los comprimidos como los archivos "<base>.<marca>" sin
+        comprimir (pendientes o cuya compresión falló), para que backupCount
+        siga acotando el espacio en disco.
+        """
+        directory, base = os.path.split(self.baseFilename)
+        prefix = f"{base}."
+        suffix = self.rotation_filename('')
+        
+        try:
+            backups: Dict[int, List[str]] = {}
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith(prefix):
+                        continue
+                    stamp = name[len(prefix):]
+                    if stamp.endswith(suffix):
+                        stamp = stamp[:-len(suffix)]
+                    if stamp.isdigit():
+                        backups.setdefault(int(stamp), []).append(entry.path)
+            
+            for stamp in sorted(backups)[:-self.backupCount]:
+                for path in backups[stamp]:
+                    os.remove(path)
+        except Exception as e:
+            logging.error(f"Error removing old log backups: {str(e)}")
     
     def rotate(self, source: str, dest: str) -> None:
         """Rota y comprime un archivo.
@@ -122,14 +442,40 @@ class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
             dest: Archivo destino
         """
         try:
-            with open(source, 'rb') as f_in:
-                with gzip.open(dest, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+            with open(source, 'rb', buffering=self.FILE_BUFFER_SIZE) as f_in, \
+                    open(dest, 'wb', buffering=self.FILE_BUFFER_SIZE) as raw:
+                if self._codec == 'zstd':
+                    compressor = zstandard.ZstdCompressor(level=self.ZSTD_LEVEL, threads=-1)
+                    f_out = compressor.stream_writer(raw, closefd=False)
+                else:
+                    f_out = gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=self.COMPRESS_LEVEL)
+                with f_out:
+                    shutil.copyfileobj(f_in, f_out, self.COPY_BUFFER_SIZE)
             os.remove(source)
         except Exception as e:
             # No propagar el error, solo loguearlo
             logging.error(f"Error rotating log file: {str(e)}")
 
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que deja el formateo completo al hilo del listener."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepara el registro para encolarlo.
+        
+        Solo se resuelven los argumentos del mensaje en el hilo que hace el log;
+        la excepción se conserva para que la formatee cada handler final.
+        
+        Args:
+            record: Registro a encolar
+            
+        Returns:
+            logging.LogRecord: Copia del registro con el mensaje resuelto
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 class CustomLogger(logging.Logger):
     """Logger personalizado con funcionalidades adicionales."""
     
@@ -169,11 +515,19 @@ class CustomLogger(logging.Logger):
             *args: Argumentos posicionales
             **kwargs: Argumentos nombrados
         """
-        if 'extra' not in kwargs:
-            kwargs['extra'] = {}
-        kwargs['extra']['metadata'] = self.metadata
+        # Sin metadatos (el caso habitual) no se toca extra
+        metadata = self.metadata
+        if metadata:
+            extra = kwargs.get('extra')
+            if extra is None:
+                kwargs['extra'] = {'metadata': metadata}
+            else:
+                extra['metadata'] = metadata
         super()._log(level, msg, *args, **kwargs)
 
+# Registrar la clase una sola vez, al importar el módulo, y no en cada get_logger
+logging.setLoggerClass(CustomLogger)
+
 def validate_log_config(
     log_dir: str,
     level: str,
@@ -196,12 +550,11 @@ def validate_log_config(
         ValueError: Si la configuración es inválida
     """
     # Validar nivel
-    valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-    if level.upper() not in valid_levels:
+    if level.upper() not in _VALID_LEVELS:
         raise ValueError(f"Invalid log level: {level}")
     
     # Validar rotación
-    if rotation not in ['daily', 'size']:
+    if rotation not in _VALID_ROTATIONS:
         raise ValueError(f"Invalid rotation type: {rotation}")
     
     # Validar retención
@@ -215,55 +568,79 @@ def validate_log_config(
 def setup_logging(settings: Settings) -> None:
     """Configure logging system using settings.
     
+    Los handlers de archivo y consola no se añaden al root logger: el root
+    logger solo encola los registros y un QueueListener los escribe desde un
+    hilo en segundo plano, de modo que los hilos del scraper no esperan por
+    el disco ni por la rotación de archivos.
+    
     Args:
         settings: Application settings instance
     """
+    global _queue_listener, _queue_handler
+    
+    # Reemplazar una configuración anterior en lugar de duplicar handlers
+    stop_logging()
+    
     log_path = settings.directories.logs_dir
-    log_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(log_path)
     
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.logging.level)
     
-    # Create formatter
-    formatter = JsonFormatter() if settings.logging.json_format else logging.Formatter(
+    # Create formatter (shared so each record is formatted once for all handlers)
+    formatter = SharedFormatter(JsonFormatter() if settings.logging.json_format else FastFormatter(
         settings.logging.format,
         datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    ))
     
-    # Configure file handler
+    # Configure file handler (files are opened on the first record they receive)
     if settings.logging.rotate:
         file_handler = CompressedRotatingFileHandler(
             filename=log_path / 'scraper.log',
             maxBytes=settings.logging.max_size,
             backupCount=settings.logging.backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True
         )
     else:
-        file_handler = logging.FileHandler(
+        file_handler = BufferedFileHandler(
             filename=log_path / 'scraper.log',
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True
         )
     
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    handlers: List[logging.Handler] = [file_handler]
     
     # Configure error log
     error_handler = CompressedRotatingFileHandler(
         filename=log_path / 'error.log',
         maxBytes=settings.logging.max_size,
         backupCount=settings.logging.backup_count,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(formatter)
-    root_logger.addHandler(error_handler)
+    handlers.append(error_handler)
     
     # Configure console output if enabled
     if settings.logging.console_output:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Encolar en el root logger y escribir desde el hilo del listener
+    log_queue: queue.Queue = queue.Queue(-1)
+    _queue_handler = LogQueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        *handlers,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Log initialization
     root_logger.info(
@@ -280,17 +657,44 @@ def setup_logging(settings: Settings) -> None:
         }
     )
 
-def get_logger(name: str) -> CustomLogger:
+def stop_logging() -> None:
+    """Detiene el listener de logging tras escribir los registros pendientes."""
+    global _queue_listener, _queue_handler
+    
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(CompressedRotatingFileHandler._rotation_executor.shutdown)
+atexit.register(stop_logging)
+
+def get_logger(name: str) -> logging.Logger:
     """Obtiene un logger personalizado.
     
+    Los loggers de clase ``logging.Logger`` creados antes de importar este
+    módulo se promueven a CustomLogger. Los de otras clases (RootLogger o
+    subclases de terceros) se devuelven sin modificar para no perder sus
+    propios métodos.
+    
     Args:
         name: Nombre del logger
         
     Returns:
-        CustomLogger: Logger personalizado
+        logging.Logger: Logger personalizado cuando es posible
     """
-    logging.setLoggerClass(CustomLogger)
-    return logging.getLogger(name)
+    logger = logging.getLogger(name)
+    if type(logger) is logging.Logger:
+        # Se promueve en el sitio para conservar sus handlers y su posición
+        # en la jerarquía
+        logger.__class__ = CustomLogger
+        logger.metadata = {}
+    return logger
 
 class LoggerAdapter(logging.LoggerAdapter):
     """Adaptador de logger con contexto."""
@@ -311,6 +715,10 @@ class LoggerAdapter(logging.LoggerAdapter):
     def process(self, msg: str, kwargs: Dict[str, Any]) -> tuple:
         """Procesa el mensaje añadiendo contexto.
         
+        Sin extra del llamante se pasa self.extra tal cual, sin copiarlo:
+        logging solo lo lee al crear el registro, así que no debe modificarse
+        mientras el adaptador esté en uso.
+        
         Args:
             msg: Mensaje a procesar
             kwargs: Argumentos adicionales
@@ -318,9 +726,11 @@ class LoggerAdapter(logging.LoggerAdapter):
         Returns:
             tuple: Mensaje y kwargs procesados
         """
-        if 'extra' not in kwargs:
-            kwargs['extra'] = {}
-        kwargs['extra'].update(self.extra)
+        extra = kwargs.get('extra')
+        if extra is None:
+            kwargs['extra'] = self.extra
+        else:
+            extra.update(self.extra)
         return msg, kwargs
 
 def get_logger_with_context(**context: Any) -> LoggerAdapter:
@@ -335,34 +745,66 @@ def get_logger_with_context(**context: Any) -> LoggerAdapter:
     logger = get_logger(__name__)
     return LoggerAdapter(logger, context)
 
-def log_execution_time(logger: Optional[logging.Logger] = None):
+def log_execution_time(logger: Optional[logging.Logger] = None, every: int = 1):
     """Decorador para registrar tiempo de ejecución.
     
+    Con every > 1 se registra una sola línea cada `every` llamadas con el
+    tiempo medio de ese bloque, para funciones llamadas en bucles intensivos.
+    Los errores se registran siempre. Los contadores no usan bloqueo: con
+    varios hilos el muestreo es aproximado.
+    
     Args:
         logger: Logger opcional (usa el del módulo si no se especifica)
+        every: Número de llamadas por cada registro de tiempo
     """
+    if every < 1:
+        raise ValueError("every must be at least 1")
+    
     def decorator(func):
+        # Llamadas y tiempo acumulado desde el último registro
+        sample = [0, 0.0]
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Usar logger proporcionado o crear uno nuevo
             _logger = logger or logging.getLogger(func.__module__)
             
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                execution_time = (datetime.now() - start_time).total_seconds()
-                _logger.info(
-                    f"Function {func.__name__} executed in {execution_time:.2f} seconds",
-                    extra={
-                        'metadata': {
-                            'function': func.__name__,
-                            'execution_time': execution_time
+                if every > 1:
+                    sample[0] += 1
+                    sample[1] += time.perf_counter() - start_time
+                    if sample[0] >= every:
+                        average_time = sample[1] / sample[0]
+                        sample[0], sample[1] = 0, 0.0
+                        if _logger.isEnabledFor(logging.INFO):
+                            _logger.info(
+                                f"Function {func.__name__} executed {every} times "
+                                f"in {average_time:.4f} seconds on average",
+                                extra={
+                                    'metadata': {
+                                        'function': func.__name__,
+                                        'execution_time': average_time,
+                                        'calls': every
+                                    }
+                                }
+                            )
+                # Sin INFO habilitado no se construye el registro
+                elif _logger.isEnabledFor(logging.INFO):
+                    execution_time = time.perf_counter() - start_time
+                    _logger.info(
+                        f"Function {func.__name__} executed in {execution_time:.2f} seconds",
+                        extra={
+                            'metadata': {
+                                'function': func.__name__,
+                                'execution_time': execution_time
+                            }
                         }
-                    }
-                )
+                    )
                 return result
             except Exception as e:
-                execution_time = (datetime.now() - start_time).total_seconds()
+                execution_time = time.perf_counter() - start_time
                 _logger.error(
                     f"Error in function {func.__name__}: {str(e)}",
                     extra={
@@ -393,14 +835,18 @@ def cleanup_old_logs(
         if not log_path.exists():
             return
             
-        cutoff = datetime.now() - timedelta(days=max_age_days)
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).timestamp()
         
-        for file in log_path.glob('*.log*'):
-            try:
-                if file.stat().st_mtime < cutoff.timestamp():
-                    file.unlink()
-            except Exception as e:
-                logging.error(f"Error deleting old log {file}: {str(e)}")
+        # Una sola pasada: scandir guarda en caché el stat de cada entrada
+        with os.scandir(log_path) as entries:
+            for entry in entries:
+                if '.log' not in entry.name or entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except Exception as e:
+                    logging.error(f"Error deleting old log {entry.path}: {str(e)}")
                 
     except Exception as e:
         logging.error(f"Error cleaning old logs: {str(e)}")
@@ -419,40 +865,49 @@ def get_log_stats(log_dir: Union[str, Path]) -> Dict[str, Any]:
         if not log_path.exists():
             return {}
             
-        stats = {
-            'total_size_mb': 0,
-            'file_count': 0,
-            'oldest_file': None,
-            'newest_file': None,
-            'files': []
-        }
+        # Una sola pasada con agregados en variables locales
+        total_bytes = 0
+        files = []
+        oldest_mtime = newest_mtime = None
+        oldest_name = newest_name = None
         
-        for file in log_path.glob('*.log*'):
-            file_stat = file.stat()
-            file_info = {
-                'name': file.name,
-                'size_mb': file_stat.st_size / (1024 * 1024),
-                'modified': datetime.fromtimestamp(file_stat.st_mtime).isoformat()
-            }
-            
-            stats['total_size_mb'] += file_info['size_mb']
-            stats['file_count'] += 1
-            stats['files'].append(file_info)
-            
-            # Actualizar oldest/newest
-            if not stats['oldest_file'] or file_stat.st_mtime < stats['oldest_file']['timestamp']:
-                stats['oldest_file'] = {
-                    'name': file.name,
-                    'timestamp': file_stat.st_mtime
-                }
-            
-            if not stats['newest_file'] or file_stat.st_mtime > stats['newest_file']['timestamp']:
-                stats['newest_file'] = {
-                    'name': file.name,
-                    'timestamp': file_stat.st_mtime
-                }
+        with os.scandir(log_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if '.log' not in name or name.startswith('.'):
+                    continue
+                entry_stat = entry.stat()
+                mtime = entry_stat.st_mtime
+                size = entry_stat.st_size
+                
+                total_bytes += size
+                files.append((name, size, mtime))
+                
+                # Actualizar oldest/newest
+                if oldest_mtime is None or mtime < oldest_mtime:
+                    oldest_mtime, oldest_name = mtime, name
+                if newest_mtime is None or mtime > newest_mtime:
+                    newest_mtime, newest_name = mtime, name
         
-        return stats
+        mb = 1024 * 1024
+        return {
+            'total_size_mb': total_bytes / mb,
+            'file_count': len(files),
+            'oldest_file': (
+                {'name': oldest_name, 'timestamp': oldest_mtime} if files else None
+            ),
+            'newest_file': (
+                {'name': newest_name, 'timestamp': newest_mtime} if files else None
+            ),
+            'files': [
+                {
+                    'name': name,
+                    'size_mb': size / mb,
+                    'modified': datetime.fromtimestamp(mtime).isoformat()
+                }
+                for name, size, mtime in files
+            ]
+        }
         
     except Exception as e:
         logging.error(f"Error getting log stats: {str(e)}")
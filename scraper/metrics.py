@@ -1,21 +1,49 @@
 """Sistema de métricas para el scraper."""
 
 import logging
+import time
 import psutil
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict
+
+# Factor de conversión de bytes a MB (una multiplicación en lugar de dos divisiones)
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+
+class MetricsReport:
+    """Reporte de métricas devuelto por MetricsManager.get_report."""
+
+    __slots__ = ("performance", "cache", "database", "errors")
+
+    def __init__(
+        self,
+        performance: Dict[str, float],
+        cache: Dict[str, float],
+        database: Dict[str, int],
+        errors: Dict[str, int],
+    ):
+        self.performance = performance
+        self.cache = cache
+        self.database = database
+        self.errors = errors
 
 
 class MetricsManager:
     """Administrador de métricas del sistema."""
 
+    # Máximo de tipos de error distintos; el resto se agrupa en "other"
+    MAX_ERROR_TYPES = 200
+
     def __init__(self):
         """Inicializar el administrador de métricas."""
         self.logger = logging.getLogger(__name__)
         self._cache_hits = 0
         self._cache_misses = 0
         self._errors: Dict[str, int] = {}
-        self._start_time = datetime.now()
+        self._start_time = time.monotonic()
+        self._process = psutil.Process()
+        # Primera llamada no bloqueante: inicia la medición para que el primer
+        # reporte devuelva el uso de CPU desde la creación del gestor
+        psutil.cpu_percent(interval=None)
 
     def record_cache_hit(self) -> None:
         """Registrar un acierto en caché."""
@@ -27,33 +55,33 @@ class MetricsManager:
 
     def record_error(self, error_type: str) -> None:
         """Registrar un error."""
+        if error_type not in self._errors and len(self._errors) >= self.MAX_ERROR_TYPES:
+            error_type = "other"
         self._errors[error_type] = self._errors.get(error_type, 0) + 1
 
     def record_cache_cleanup(self, keys_removed: int, bytes_freed: int) -> None:
         """Registrar una limpieza de caché."""
-        self.logger.info(f"Cache cleanup: removed {keys_removed} keys, freed {bytes_freed} bytes")
+        self.logger.info(
+            "Cache cleanup: removed %s keys, freed %s bytes", keys_removed, bytes_freed
+        )
 
-    def get_report(self) -> Any:
+    def get_report(self) -> MetricsReport:
         """Obtener reporte de métricas."""
-        return type(
-            "MetricsReport",
-            (),
-            {
-                "performance": {
-                    "cpu_percent": psutil.cpu_percent(),
-                    "memory_mb": psutil.Process().memory_info().rss / 1024 / 1024,
-                    "uptime_seconds": (datetime.now() - self._start_time).total_seconds(),
-                },
-                "cache": {
-                    "hits": self._cache_hits,
-                    "misses": self._cache_misses,
-                    "hit_ratio": (
-                        self._cache_hits / (self._cache_hits + self._cache_misses)
-                        if (self._cache_hits + self._cache_misses) > 0
-                        else 0
-                    ),
-                },
-                "database": {"connections": 0},  # Placeholder para futuras métricas de DB
-                "errors": self._errors,
+        return MetricsReport(
+            performance={
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "memory_mb": self._process.memory_info().rss * _BYTES_TO_MB,
+                "uptime_seconds": time.monotonic() - self._start_time,
+            },
+            cache={
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_ratio": (
+                    self._cache_hits / (self._cache_hits + self._cache_misses)
+                    if (self._cache_hits + self._cache_misses) > 0
+                    else 0
+                ),
             },
+            database={"connections": 0},  # Placeholder para futuras métricas de DB
+            errors=self._errors,
         )
@@ -1,19 +1,25 @@
 """Sistema unificado de métricas."""
 
+import sys
 import time
 import psutil
 import logging
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Union, Tuple, Callable, Iterator
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
 import threading
+import collections
 from collections import deque
+from functools import lru_cache
+from itertools import islice
 import atexit
+import errno
 import os
+from wsgiref.simple_server import make_server, WSGIRequestHandler
 from prometheus_client import (
-    start_http_server,
+    make_wsgi_app,
     Counter,
     Gauge,
     Histogram,
@@ -21,6 +27,13 @@ from prometheus_client import (
     CollectorRegistry
 )
 from prometheus_client.core import GaugeMetricFamily, CounterMetricFamily
+from prometheus_client.exposition import ThreadingWSGIServer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..settings import Settings
 from ..logging_config import (
@@ -31,7 +44,47 @@ from ..logging_config import (
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# slots=True solo está disponible en dataclasses a partir de Python 3.10
+_DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Factor de conversión de bytes a MB (una multiplicación en lugar de dos divisiones)
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Primera llamada no bloqueante: fija la referencia para que cada
+# SystemStats.collect obtenga el uso de CPU desde la muestra anterior
+psutil.cpu_percent(interval=None)
+
+# Segundos mínimos entre lecturas de CPU; dentro de esa ventana se devuelve
+# la última muestra (ventanas más cortas dan porcentajes poco significativos)
+_CPU_SAMPLE_TTL = 5.0
+_cpu_sample = (time.monotonic(), 0.0)
+
+def _sample_cpu_percent() -> float:
+    """Devuelve el uso de CPU, releyéndolo como mucho cada _CPU_SAMPLE_TTL segundos."""
+    global _cpu_sample
+    sampled_at, value = _cpu_sample
+    now = time.monotonic()
+    if now - sampled_at >= _CPU_SAMPLE_TTL:
+        value = psutil.cpu_percent(interval=None)
+        _cpu_sample = (now, value)
+    return value
+
+@lru_cache(maxsize=1)
+def _iso_timestamp_for_second(second: int) -> str:
+    """Marca de tiempo local en formato ISO, memorizada por segundo."""
+    return datetime.fromtimestamp(second).isoformat()
+
+def _now_iso() -> str:
+    """Marca de tiempo actual en formato ISO, recalculada como mucho una vez por segundo."""
+    return _iso_timestamp_for_second(int(time.time()))
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    """Manejador WSGI que no escribe cada scrape en stderr."""
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+@dataclass(**_DATACLASS_SLOTS)
 class SystemStats:
     """Estadísticas del sistema."""
     cpu_percent: float
@@ -44,24 +97,26 @@ class SystemStats:
     def collect(cls) -> 'SystemStats':
         """Recolecta estadísticas del sistema."""
         try:
-            # CPU y memoria base
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU (sin bloquear: uso desde la muestra anterior) y memoria base
+            cpu_percent = _sample_cpu_percent()
             process = psutil.Process()
-            memory_info = process.memory_info()
+            # Una sola lectura de /proc para memoria, I/O y hora de inicio
+            info = process.as_dict(attrs=['memory_info', 'io_counters', 'create_time'])
+            memory_info = info['memory_info']
             
             # Estadísticas detalladas de memoria
             memory_stats = {
-                'rss_mb': memory_info.rss / 1024 / 1024,
-                'vms_mb': memory_info.vms / 1024 / 1024,
-                'shared_mb': memory_info.shared / 1024 / 1024,
-                'text_mb': memory_info.text / 1024 / 1024,
-                'lib_mb': memory_info.lib / 1024 / 1024,
-                'data_mb': memory_info.data / 1024 / 1024,
-                'dirty_mb': memory_info.dirty / 1024 / 1024
+                'rss_mb': memory_info.rss * _BYTES_TO_MB,
+                'vms_mb': memory_info.vms * _BYTES_TO_MB,
+                'shared_mb': memory_info.shared * _BYTES_TO_MB,
+                'text_mb': memory_info.text * _BYTES_TO_MB,
+                'lib_mb': memory_info.lib * _BYTES_TO_MB,
+                'data_mb': memory_info.data * _BYTES_TO_MB,
+                'dirty_mb': memory_info.dirty * _BYTES_TO_MB
             }
             
             # Estadísticas de I/O
-            io_counters = process.io_counters()
+            io_counters = info['io_counters']
             io_stats = {
                 'read_bytes': io_counters.read_bytes,
                 'write_bytes': io_counters.write_bytes,
@@ -87,11 +142,11 @@ class SystemStats:
                 memory_stats=memory_stats,
                 io_stats=io_stats,
                 network_stats=network_stats,
-                uptime_seconds=time.time() - process.create_time()
+                uptime_seconds=time.time() - info['create_time']
             )
             
         except Exception as e:
-            logger.error(f"Error collecting system stats: {str(e)}")
+            logger.error("Error collecting system stats: %s", e)
             return cls(
                 cpu_percent=0.0,
                 memory_stats={'error': 'Failed to collect'},
@@ -100,7 +155,7 @@ class SystemStats:
                 uptime_seconds=0.0
             )
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class MetricsReport:
     """Reporte de métricas."""
     system_stats: SystemStats
@@ -109,23 +164,31 @@ class MetricsReport:
     errors: Dict[str, int]
     timestamp: str
 
-@dataclass
 class MetricsBuffer:
     """Circular buffer for metrics."""
-    max_size: int
-    data: deque = field(default_factory=deque)
     
-    def __post_init__(self):
-        """Post-initialization validation."""
-        if self.max_size < 1:
+    __slots__ = ('max_size', 'data')
+    
+    def __init__(self, max_size: int, data: Optional[deque] = None):
+        """Initialize the buffer.
+        
+        Args:
+            max_size: Maximum number of items kept
+            data: Optional initial items
+        """
+        if max_size < 1:
             raise ValueError("Buffer size must be positive")
-        if not isinstance(self.data, deque):
+        if data is not None and not isinstance(data, deque):
             raise TypeError("Data must be a deque")
+        self.max_size = max_size
+        # maxlen descarta el elemento más antiguo en cada append
+        self.data = deque(data or (), maxlen=max_size)
+    
+    def __repr__(self) -> str:
+        return f"MetricsBuffer(max_size={self.max_size}, data={self.data!r})"
     
     def add(self, item: Any) -> None:
         """Add an item to the buffer."""
-        if len(self.data) >= self.max_size:
-            self.data.popleft()
         self.data.append(item)
     
     def clear(self) -> None:
@@ -135,6 +198,17 @@ class MetricsBuffer:
     def get_all(self) -> List[Any]:
         """Get all items."""
         return list(self.data)
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items, oldest first, without copying them."""
+        return iter(self.data)
+    
+    def tail(self, count: int) -> List[Any]:
+        """Get the ``count`` most recent items, oldest first."""
+        # Recorrer desde el final: O(count) en lugar de O(len(data))
+        items = list(islice(reversed(self.data), max(0, count)))
+        items.reverse()
+        return items
 
 class MetricsCollector:
     """Custom metrics collector for Prometheus."""
@@ -146,65 +220,88 @@ class MetricsCollector:
             metrics_manager: Metrics manager instance
         """
         self.metrics = metrics_manager
-    
-    def collect(self):
-        """Collect metrics for Prometheus."""
-        # Performance metrics
-        performance = self.metrics.get_performance_metrics()
         
-        cpu_metric = GaugeMetricFamily(
+        # Las familias se construyen una sola vez; en cada scrape solo se
+        # renuevan sus muestras. El lock evita que dos scrapes concurrentes
+        # mezclen muestras sobre los mismos objetos.
+        self._lock = threading.Lock()
+        self._cpu_family = GaugeMetricFamily(
             'scraper_cpu_usage_percent',
-            'CPU usage percentage',
-            value=performance['cpu_percent']
+            'CPU usage percentage'
         )
-        yield cpu_metric
-        
-        memory_metric = GaugeMetricFamily(
+        self._memory_family = GaugeMetricFamily(
             'scraper_memory_usage_mb',
-            'Memory usage in MB',
-            value=performance['memory_mb']
+            'Memory usage in MB'
         )
-        yield memory_metric
-        
-        uptime_metric = CounterMetricFamily(
+        self._uptime_family = CounterMetricFamily(
             'scraper_uptime_seconds',
-            'Uptime in seconds',
-            value=performance['uptime_seconds']
+            'Uptime in seconds'
         )
-        yield uptime_metric
-        
-        # Cache metrics
-        cache_hits = CounterMetricFamily(
+        self._cache_hits_family = CounterMetricFamily(
             'scraper_cache_hits_total',
             'Total number of cache hits'
         )
-        cache_hits.add_metric([], self.metrics.cache_hits)
-        yield cache_hits
-        
-        cache_misses = CounterMetricFamily(
+        self._cache_misses_family = CounterMetricFamily(
             'scraper_cache_misses_total',
             'Total number of cache misses'
         )
-        cache_misses.add_metric([], self.metrics.cache_misses)
-        yield cache_misses
-        
-        # Database metrics
-        db_connections = GaugeMetricFamily(
+        self._db_conn_family = GaugeMetricFamily(
             'scraper_db_connections',
             'Number of active database connections'
         )
-        db_connections.add_metric([], self.metrics.db_connections)
-        yield db_connections
+        self._error_family = CounterMetricFamily(
+            'scraper_errors_total',
+            'Total number of errors by type',
+            labels=['type']
+        )
+        self._families = (
+            self._cpu_family,
+            self._memory_family,
+            self._uptime_family,
+            self._cache_hits_family,
+            self._cache_misses_family,
+            self._db_conn_family,
+            self._error_family
+        )
+    
+    def collect(self):
+        """Collect metrics for Prometheus."""
+        performance = self.metrics.get_performance_metrics()
         
-        # Error metrics
-        for error_type, count in self.metrics.error_counts.items():
-            error_metric = CounterMetricFamily(
-                'scraper_errors_total',
-                'Total number of errors by type',
-                labels=['type']
-            )
-            error_metric.add_metric([error_type], count)
-            yield error_metric
+        with self._lock:
+            for family in self._families:
+                family.samples = []
+            
+            # Performance metrics
+            self._cpu_family.add_metric([], performance['cpu_percent'])
+            self._memory_family.add_metric([], performance['memory_mb'])
+            self._uptime_family.add_metric([], performance['uptime_seconds'])
+            
+            # Cache metrics
+            self._cache_hits_family.add_metric([], self.metrics.cache_hits)
+            self._cache_misses_family.add_metric([], self.metrics.cache_misses)
+            
+            # Database metrics
+            self._db_conn_family.add_metric([], self.metrics.db_connections)
+            
+            # Error metrics: una sola familia con una muestra por tipo
+            for error_name, count in self.metrics.error_totals().items():
+                self._error_family.add_metric([error_name], count)
+            
+            yield from self._families
+
+@lru_cache(maxsize=256)
+def _standardize_metric_name(name: str) -> str:
+    """Aplica los prefijos estándar de MetricsManager a un nombre de métrica.
+    
+    'cache.node.status' pasa a 'cache_node_status'. Los puntos restantes se
+    sustituyen por '_' porque Prometheus no los admite en los nombres. Los
+    nombres recurrentes son pocos y fijos, así que el resultado se memoiza.
+    """
+    prefix, sep, rest = name.partition('.')
+    if sep and prefix in MetricsManager.METRIC_PREFIXES:
+        name = f"{MetricsManager.METRIC_PREFIXES[prefix]}_{rest}"
+    return name.replace('.', '_')
 
 class MetricsManager:
     """Gestor unificado de métricas."""
@@ -218,6 +315,18 @@ class MetricsManager:
         'error': 'error'
     }
     
+    # Máximo de tipos de error distintos; el resto se agrupa en "other"
+    MAX_ERROR_TYPES = 200
+    
+    # Segundos durante los que get_report reutiliza el último reporte
+    REPORT_TTL = 1.0
+    
+    # Segundos durante los que se comparte la misma muestra de SystemStats
+    STATS_TTL = 2.0
+    
+    # Segundos durante los que se reutiliza el último uso de disco leído
+    DISK_USAGE_TTL = 30.0
+    
     def __init__(
         self,
         settings: Optional[Settings] = None,
@@ -233,11 +342,22 @@ class MetricsManager:
         """
         self.logger = logging.getLogger(__name__)
         self.settings = settings
-        self.start_time = time.time()
-        self.error_counts: Dict[str, int] = {}
+        self.start_time = time.monotonic()
+        # Contador por tipo de error tal y como se recibe; el nombre
+        # "error_<tipo>" solo se construye al exportar (ver error_totals)
+        self.error_counts: Dict[str, int] = collections.Counter()
         self.cache_hits = 0
         self.cache_misses = 0
         self.db_connections = 0
+        self._cached_report: Optional[MetricsReport] = None
+        self._cached_at = 0.0
+        self._stats_cache: Optional[Tuple[float, SystemStats]] = None
+        self._stats_lock = threading.Lock()
+        
+        # La memoria total no cambia durante la vida del proceso; el uso de
+        # disco se relee como mucho cada DISK_USAGE_TTL segundos
+        self._total_memory_mb = psutil.virtual_memory().total * _BYTES_TO_MB
+        self._disk_cache: Optional[Tuple[float, float]] = None
         
         # Configuración Prometheus
         self.registry = CollectorRegistry()
@@ -246,6 +366,11 @@ class MetricsManager:
         self.metrics_addr = metrics_addr
         self.metrics_server = None
         
+        # Gauges personalizados (registrados en self.registry) por nombre y
+        # claves de etiqueta, y setters ya resueltos por nombre y etiquetas
+        self._custom_gauges: Dict[Tuple[str, Tuple[str, ...]], Gauge] = {}
+        self._metric_setters: Dict[Tuple[str, Tuple], Callable[[float], None]] = {}
+        
         # Estadísticas de migración
         self.migration_stats = {
             'total_migrations': 0,
@@ -265,21 +390,54 @@ class MetricsManager:
         atexit.register(self.cleanup)
 
     def start(self) -> None:
-        """Start metrics collection and server."""
+        """Start metrics collection and server.
+        
+        The /metrics endpoint is served by a threading WSGI server on a
+        daemon thread, so concurrent scrapes are handled in parallel. If
+        the configured port is busy, the kernel assigns a free one and
+        ``metrics_port`` is updated to it.
+        """
+        if self.metrics_server is not None:
+            return
         try:
-            start_http_server(
-                port=self.metrics_port,
-                addr=self.metrics_addr,
-                registry=self.registry
-            )
+            app = make_wsgi_app(self.registry)
+            try:
+                self.metrics_server = self._make_metrics_server(self.metrics_port, app)
+            except OSError as e:
+                if e.errno != errno.EADDRINUSE:
+                    raise
+                self.logger.warning(
+                    "Metrics port %s in use, binding a free port", self.metrics_port
+                )
+                self.metrics_server = self._make_metrics_server(0, app)
+            self.metrics_port = self.metrics_server.server_port
+            threading.Thread(
+                target=self.metrics_server.serve_forever,
+                name='metrics-server',
+                daemon=True
+            ).start()
             self.logger.info(
-                f"Metrics server started on {self.metrics_addr}:{self.metrics_port}"
+                "Metrics server started on %s:%s", self.metrics_addr, self.metrics_port
             )
         except Exception as e:
-            self.logger.error(f"Failed to start metrics server: {str(e)}")
+            self.logger.error("Failed to start metrics server: %s", e)
+
+    def _make_metrics_server(self, port: int, app: Callable) -> ThreadingWSGIServer:
+        """Bind the metrics WSGI server on ``port`` (0 picks a free one)."""
+        return make_server(
+            self.metrics_addr,
+            port,
+            app,
+            ThreadingWSGIServer,
+            handler_class=_QuietRequestHandler
+        )
 
     def stop(self) -> None:
         """Stop metrics collection."""
+        if self.metrics_server is not None:
+            self.metrics_server.shutdown()
+            self.metrics_server.server_close()
+            self.metrics_server = None
         self.cleanup()
         self.logger.info("Metrics collection stopped")
 
@@ -302,35 +460,51 @@ class MetricsManager:
             labels: Etiquetas opcionales
         """
         # Estandarizar nombre de métrica
-        parts = name.split('.')
-        if len(parts) > 1 and parts[0] in self.METRIC_PREFIXES:
-            prefix = self.METRIC_PREFIXES[parts[0]]
-            name = f"{prefix}_{'.'.join(parts[1:])}"
+        name = _standardize_metric_name(name)
         
-        # Registrar en Prometheus
-        metric = Gauge(name, name, labelnames=list(labels.keys()) if labels else [])
-        metric.labels(**labels).set(value) if labels else metric.set(value)
+        # Registrar en Prometheus; el gauge y su hijo etiquetado se resuelven
+        # una sola vez y luego solo se invoca el setter guardado
+        key = (name, tuple(labels.items()) if labels else ())
+        setter = self._metric_setters.get(key)
+        if setter is None:
+            label_names = tuple(sorted(labels)) if labels else ()
+            metric = self._custom_gauges.get((name, label_names))
+            if metric is None:
+                metric = Gauge(name, name, labelnames=label_names, registry=self.registry)
+                self._custom_gauges[(name, label_names)] = metric
+            setter = (metric.labels(**labels) if labels else metric).set
+            self._metric_setters[key] = setter
+        setter(value)
     
     def record_error(self, error_type: str) -> None:
         """Registra un error."""
-        error_name = f"error_{error_type.lower()}"
-        self.error_counts[error_name] = self.error_counts.get(error_name, 0) + 1
-        self.logger.debug(f"Recorded error of type: {error_type}")
+        if error_type not in self.error_counts and len(self.error_counts) >= self.MAX_ERROR_TYPES:
+            error_type = "other"
+        self.error_counts[error_type] += 1
+        self.logger.debug("Recorded error of type: %s", error_type)
+    
+    def error_totals(self) -> Dict[str, int]:
+        """Devuelve los errores agrupados por nombre normalizado ("error_<tipo>")."""
+        totals: Dict[str, int] = {}
+        for error_type, count in list(self.error_counts.items()):
+            error_name = f"error_{error_type.lower()}"
+            totals[error_name] = totals.get(error_name, 0) + count
+        return totals
+    
+    # Los contadores de caché y base de datos solo se incrementan aquí;
+    # MetricsCollector los lee al servir cada scrape.
     
     def record_cache_hit(self) -> None:
         """Registra un hit de caché."""
         self.cache_hits += 1
-        self.record_custom_metric('cache.hits', self.cache_hits)
     
     def record_cache_miss(self) -> None:
         """Registra un miss de caché."""
         self.cache_misses += 1
-        self.record_custom_metric('cache.misses', self.cache_misses)
     
     def record_db_connection(self) -> None:
         """Registra una conexión a base de datos."""
         self.db_connections += 1
-        self.record_custom_metric('db.connections', self.db_connections)
     
     def record_migration_success(self, task_id: str) -> None:
         """Registra una migración exitosa."""
@@ -384,25 +558,48 @@ class MetricsManager:
             self.migration_stats['failed_rebalancing']
         )
 
+    def _get_stats(self) -> SystemStats:
+        """Return system stats, sampling at most once every STATS_TTL seconds.
+        
+        Scrapes served concurrently by the metrics server and get_report
+        share the same sample instead of each reading /proc again.
+        """
+        with self._stats_lock:
+            now = time.monotonic()
+            if self._stats_cache is not None and now - self._stats_cache[0] < self.STATS_TTL:
+                return self._stats_cache[1]
+            stats = SystemStats.collect()
+            self._stats_cache = (now, stats)
+            return stats
+
+    def _get_disk_usage(self) -> float:
+        """Return root disk usage percent, re-reading it every DISK_USAGE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._disk_cache
+        if cached is not None and now - cached[0] < self.DISK_USAGE_TTL:
+            return cached[1]
+        percent = psutil.disk_usage('/').percent
+        self._disk_cache = (now, percent)
+        return percent
+
     def get_performance_metrics(self) -> Dict[str, float]:
         """Get system performance metrics."""
         try:
-            stats = SystemStats.collect()
+            stats = self._get_stats()
             
             # Check resource thresholds
-            memory_percent = (stats.memory_stats['rss_mb'] / 
-                            (psutil.virtual_memory().total / 1024 / 1024)) * 100
-            disk_usage = psutil.disk_usage('/').percent
+            memory_percent = (stats.memory_stats['rss_mb'] / self._total_memory_mb) * 100
+            disk_usage = self._get_disk_usage()
             
             # Resource alerts
             if memory_percent > 85:
-                self.logger.warning(f"High memory usage: {memory_percent:.1f}%")
+                self.logger.warning("High memory usage: %.1f%%", memory_percent)
             
             if disk_usage > 90:
-                self.logger.warning(f"High disk usage: {disk_usage:.1f}%")
+                self.logger.warning("High disk usage: %.1f%%", disk_usage)
             
             if stats.cpu_percent > 80:
-                self.logger.warning(f"High CPU usage: {stats.cpu_percent:.1f}%")
+                self.logger.warning("High CPU usage: %.1f%%", stats.cpu_percent)
             
             return {
                 'cpu_percent': stats.cpu_percent,
@@ -410,23 +607,36 @@ class MetricsManager:
                 'memory_percent': memory_percent,
                 'disk_usage_percent': disk_usage,
                 'uptime_seconds': stats.uptime_seconds,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
         except Exception as e:
-            self.logger.error(f"Error getting performance metrics: {str(e)}")
+            self.logger.error("Error getting performance metrics: %s", e)
             return {
                 'cpu_percent': 0.0,
                 'memory_mb': 0.0,
                 'memory_percent': 0.0,
                 'disk_usage_percent': 0.0,
                 'uptime_seconds': 0.0,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
 
     def get_report(self) -> MetricsReport:
-        """Generate a complete metrics report."""
+        """Generate a complete metrics report.
+        
+        Reports requested within REPORT_TTL seconds of the previous one
+        reuse it instead of sampling the system again.
+        """
+        if (self._cached_report is not None
+                and time.perf_counter() - self._cached_at < self.REPORT_TTL):
+            return self._cached_report
+        self._cached_report = self._build_report()
+        self._cached_at = time.perf_counter()
+        return self._cached_report
+
+    def _build_report(self) -> MetricsReport:
+        """Build a metrics report from the current counters."""
         return MetricsReport(
-            system_stats=SystemStats.collect(),
+            system_stats=self._get_stats(),
             database={'connections': self.db_connections},
             cache={
                 'hits': self.cache_hits,
@@ -434,8 +644,8 @@ class MetricsManager:
                 'hit_ratio': self._calculate_hit_ratio(),
                 **self.migration_stats
             },
-            errors=self.error_counts,
-            timestamp=datetime.now().isoformat()
+            errors=self.error_totals(),
+            timestamp=_now_iso()
         )
 
     def _calculate_hit_ratio(self) -> float:
@@ -448,32 +658,40 @@ class MetricsManager:
     def _save_final_report(self) -> None:
         """Save final metrics report."""
         try:
-            report = self.get_report()
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            report = self._build_report()
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename = self.metrics_dir / f'metrics_report_{timestamp}.json'
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(report.__dict__, f, indent=2, default=str)
-                
-            self.logger.info(f"Final metrics report saved to {filename}")
+            data = asdict(report)
+            if ORJSON_AVAILABLE:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, default=str)
+            
+            self.logger.info("Final metrics report saved to %s", filename)
             
         except Exception as e:
-            self.logger.error(f"Error saving final metrics report: {str(e)}")
+            self.logger.error("Error saving final metrics report: %s", e)
 
     def _cleanup_old_logs(self) -> None:
         """Clean up old metric logs."""
         try:
-            cutoff = datetime.now() - timedelta(days=7)
-            for file in self.metrics_dir.glob('*.json'):
-                if file.stat().st_mtime < cutoff.timestamp():
-                    file.unlink()
+            cutoff_ts = (datetime.now() - timedelta(days=7)).timestamp()
+            with os.scandir(self.metrics_dir) as entries:
+                for entry in entries:
+                    if (entry.name.endswith('.json') and entry.is_file()
+                            and entry.stat().st_mtime < cutoff_ts):
+                        os.unlink(entry.path)
             self.logger.info("Old metric logs cleaned up")
         except Exception as e:
-            self.logger.error(f"Error cleaning up old logs: {str(e)}")
+            self.logger.error("Error cleaning up old logs: %s", e)
 
     def reset_counters(self) -> None:
         """Reset all metric counters."""
         self.error_counts.clear()
+        self._cached_report = None
         self.cache_hits = 0
         self.cache_misses = 0
         self.db_connections = 0
@@ -1,12 +1,28 @@
 import random
+from itertools import accumulate
 from fake_useragent import UserAgent
 from scrapy import signals
 from scrapy.exceptions import NotConfigured
+from twisted.internet.task import deferLater
 from scraper.settings import PROXY_LIST
 
 class RandomUserAgentMiddleware:
     def __init__(self):
         self.ua = UserAgent()
+        # UserAgent.random filters the whole browser dataset on every call, so
+        # flatten the filtered dataset once and pick from it per request,
+        # weighted by usage share through precomputed cumulative weights
+        filter_useragents = getattr(self.ua, '_filter_useragents', None)
+        browsers = filter_useragents() if filter_useragents else []
+        self._ua_pool = tuple(browser['useragent'] for browser in browsers)
+        self._ua_cum_weights = tuple(accumulate(browser['percent'] for browser in browsers))
+        self._rng = random.Random()
+
+    def _choose_user_agent(self):
+        if not self._ua_pool:
+            # Dataset layout not recognised: let the library pick
+            return self.ua.random
+        return self._rng.choices(self._ua_pool, cum_weights=self._ua_cum_weights)[0]
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -18,13 +34,16 @@ class RandomUserAgentMiddleware:
         spider.logger.info('Spider opened: %s' % spider.name)
 
     def process_request(self, request, spider):
-        request.headers['User-Agent'] = self.ua.random
+        request.headers['User-Agent'] = self._choose_user_agent()
 
 class ProxyMiddleware:
     def __init__(self):
         if not PROXY_LIST:
             raise NotConfigured('No proxy list configured')
-        self.proxies = PROXY_LIST
+        self.proxies = tuple(PROXY_LIST)
+        # Per-instance generator with its choice method bound once
+        self._rng = random.Random()
+        self._choose_proxy = self._rng.choice
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -32,7 +51,7 @@ class ProxyMiddleware:
 
     def process_request(self, request, spider):
         if self.proxies:
-            request.meta['proxy'] = random.choice(self.proxies)
+            request.meta['proxy'] = self._choose_proxy(self.proxies)
 
 class HumanBehaviorMiddleware:
     def __init__(self):
@@ -44,7 +63,11 @@ class HumanBehaviorMiddleware:
         return cls()
 
     def process_request(self, request, spider):
-        # Simulate random delays between requests
+        # Simulate random delays between requests. The request is resumed when
+        # the Deferred fires, so the reactor keeps serving other downloads
+        # meanwhile (the reactor is imported here so the one configured by
+        # Scrapy is used)
+        from twisted.internet import reactor
         delay = random.uniform(self.min_delay, self.max_delay)
         spider.logger.info(f'Waiting {delay} seconds before next request')
-        return None 
\ No newline at end of file
+        return deferLater(reactor, delay, lambda: None)
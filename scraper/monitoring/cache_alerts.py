@@ -1,9 +1,13 @@
 """Sistema de alertas para la caché distribuida."""
 
 import logging
+import os
 import time
 import threading
-from typing import Dict, Any, List, Optional, Callable
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Callable, IO
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
@@ -48,24 +52,24 @@ class AlertRule:
         self.cooldown = cooldown
         self.aggregation_window = aggregation_window
         
-        self.last_triggered: Optional[datetime] = None
+        # Último disparo en segundos de time.monotonic()
+        self.last_triggered = float('-inf')
         self.triggered_count = 0
     
-    def should_trigger(self, stats: Dict[str, Any]) -> bool:
+    def should_trigger(self, stats: Dict[str, Any], now: Optional[float] = None) -> bool:
         """Verifica si la alerta debe dispararse.
         
         Args:
             stats: Estadísticas del sistema
+            now: Instante actual de time.monotonic() (se obtiene si no se indica)
             
         Returns:
             bool: True si la alerta debe dispararse
         """
-        if self.last_triggered:
-            time_since_last = (
-                datetime.now() - self.last_triggered
-            ).total_seconds()
-            if time_since_last < self.cooldown:
-                return False
+        if now is None:
+            now = time.monotonic()
+        if now - self.last_triggered < self.cooldown:
+            return False
         
         return self.condition(stats)
     
@@ -81,14 +85,24 @@ class AlertRule:
         return self.message_template.format(**stats)
 
 class AlertManager:
-    """Gestor de alertas para la caché distribuida."""
+    """Gestor de alertas para la caché distribuida.
+    
+    El historial se guarda en formato JSON Lines: cada alerta se añade como
+    una línea al final del archivo, sin reescribir las anteriores.
+    """
+    
+    # Alertas conservadas en memoria para get_alert_history
+    MAX_HISTORY = 10000
+    
+    # Tamaño a partir del cual el archivo de historial se rota a "<archivo>.1"
+    HISTORY_MAX_BYTES = 10 * 1024 * 1024
     
     def __init__(
         self,
         monitor: CacheMonitor,
         config: CacheConfig,
         check_interval: int = 60,
-        alert_history_file: str = 'alerts/cache_alerts.json',
+        alert_history_file: str = 'alerts/cache_alerts.jsonl',
         email_config: Optional[Dict[str, Any]] = None,
         slack_config: Optional[Dict[str, Any]] = None
     ):
@@ -98,8 +112,9 @@ class AlertManager:
             monitor: Monitor de caché
             config: Configuración de la caché
             check_interval: Intervalo de chequeo en segundos
-            alert_history_file: Archivo para guardar historial
-            email_config: Configuración de email
+            alert_history_file: Archivo JSON Lines para guardar historial
+            email_config: Configuración de email (con ``persistent`` se
+                reutiliza la conexión SMTP entre alertas)
             slack_config: Configuración de Slack
         """
         self.monitor = monitor
@@ -110,7 +125,22 @@ class AlertManager:
         self.slack_config = slack_config
         
         self.rules: List[AlertRule] = []
+        # Historial en orden cronológico y, en paralelo, el instante de cada
+        # alerta (segundos epoch) para filtrar por rango con bisect
         self.alert_history: List[Dict[str, Any]] = []
+        self._alert_ts = array('d')
+        self._history_fh: Optional[IO[str]] = None
+        
+        # Conexiones reutilizadas entre notificaciones (se crean al primer uso)
+        self._http = None
+        self._smtp: Optional[smtplib.SMTP] = None
+        
+        # Ventanas de agregación abiertas por regla: fin de la ventana (en
+        # time.monotonic()) y repeticiones acumuladas sin notificar
+        self._window_end: Dict[str, float] = {}
+        self._pending: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.suppressed_count = 0
+        
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self.lock = threading.Lock()
@@ -221,8 +251,31 @@ class AlertManager:
             self.thread.join()
             self.thread = None
         
+        # Notificar las repeticiones que sigan pendientes antes de cerrar
+        self._flush_pending()
+        
+        with self.lock:
+            if self._history_fh is not None:
+                self._history_fh.close()
+                self._history_fh = None
+        
+        self._close_connections()
+        
         logger.info("Alert manager stopped")
     
+    def _close_connections(self) -> None:
+        """Cierra las conexiones de notificación reutilizadas."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                self._smtp.close()
+            self._smtp = None
+    
     def _alert_loop(self) -> None:
         """Loop principal de alertas."""
         while self.running:
@@ -234,25 +287,156 @@ class AlertManager:
                 time.sleep(self.check_interval)
     
     def _check_alerts(self) -> None:
-        """Verifica las alertas."""
+        """Verifica las alertas.
+        
+        La primera alerta de una regla se notifica en el momento y abre una
+        ventana de ``max(cooldown, aggregation_window)`` segundos. Las
+        repeticiones dentro de la ventana no se notifican: se acumulan y, al
+        cerrarse, se envían en un único resumen que ocupa el siguiente envío
+        permitido, así que nunca hay más notificaciones que con el cooldown.
+        
+        Si la condición ya no se cumple al cerrarse la ventana, el resumen
+        solo se notifica cuando agrupa al menos dos repeticiones; una
+        repetición aislada se guarda en el historial sin notificarse.
+        """
         system_health = self.monitor.get_system_health()
         
+        # Un único instante por ciclo para los cooldowns; la hora de reloj
+        # solo se calcula si alguna regla se dispara
+        now = time.monotonic()
+        triggered_at: Optional[datetime] = None
+        
         for rule in self.rules:
-            if rule.should_trigger(system_health):
-                alert = {
-                    'timestamp': datetime.now().isoformat(),
-                    'rule_name': rule.name,
-                    'severity': rule.severity,
-                    'message': rule.format_message(system_health)
-                }
-                
-                self._handle_alert(alert, rule.notification_channels)
-                rule.last_triggered = datetime.now()
+            window_end = self._window_end.get(rule.name)
+            if window_end is not None and now < window_end:
+                # Ventana abierta: las repeticiones solo se acumulan
+                if rule.condition(system_health):
+                    if triggered_at is None:
+                        triggered_at = datetime.now()
+                    self._pending[rule.name].append(
+                        self._build_alert(rule, system_health, triggered_at)
+                    )
+                    rule.triggered_count += 1
+                    self.suppressed_count += 1
+                continue
+            
+            # Ventana cerrada (o inexistente): se notifica la alerta actual
+            # junto con las repeticiones acumuladas
+            self._window_end.pop(rule.name, None)
+            alerts = self._pending.pop(rule.name, [])
+            triggered = rule.should_trigger(system_health, now)
+            if triggered:
+                if triggered_at is None:
+                    triggered_at = datetime.now()
+                alerts.append(self._build_alert(rule, system_health, triggered_at))
                 rule.triggered_count += 1
-                
-                with self.lock:
-                    self.alert_history.append(alert)
-                    self._save_history()
+            elif not alerts:
+                continue
+            
+            if triggered_at is None:
+                triggered_at = datetime.now()
+            # Una repetición aislada sin alerta actual solo va al historial
+            send = triggered or len(alerts) >= 2
+            self._notify(rule, alerts, triggered_at, send=send)
+            if not send:
+                continue
+            rule.last_triggered = now
+            self._window_end[rule.name] = now + max(rule.cooldown, rule.aggregation_window)
+    
+    def _flush_pending(self) -> None:
+        """Notifica los resúmenes pendientes y cierra todas las ventanas."""
+        triggered_at = datetime.now()
+        for rule in self.rules:
+            alerts = self._pending.pop(rule.name, [])
+            if alerts:
+                self._notify(rule, alerts, triggered_at, send=len(alerts) >= 2)
+        self._window_end.clear()
+    
+    @staticmethod
+    def _build_alert(
+        rule: AlertRule,
+        stats: Dict[str, Any],
+        triggered_at: datetime
+    ) -> Dict[str, Any]:
+        """Construye los datos de una alerta.
+        
+        Args:
+            rule: Regla disparada
+            stats: Estadísticas del sistema
+            triggered_at: Instante del ciclo de chequeo
+            
+        Returns:
+            Dict[str, Any]: Datos de la alerta
+        """
+        return {
+            'timestamp': triggered_at.isoformat(),
+            'rule_name': rule.name,
+            'severity': rule.severity,
+            'message': rule.format_message(stats)
+        }
+    
+    def _notify(
+        self,
+        rule: AlertRule,
+        alerts: List[Dict[str, Any]],
+        triggered_at: datetime,
+        send: bool = True
+    ) -> None:
+        """Envía una alerta (o el resumen de varias) y la guarda en el historial.
+        
+        El resumen se fecha en el momento del envío y no en el de su última
+        repetición, para que el historial siga en orden cronológico.
+        
+        Args:
+            rule: Regla que generó las alertas
+            alerts: Alertas a notificar, en orden cronológico
+            triggered_at: Instante del envío
+            send: Si es False, la alerta solo se guarda en el historial
+        """
+        timestamp = triggered_at.isoformat()
+        alert = alerts[-1]
+        if len(alerts) > 1 or alert['timestamp'] != timestamp:
+            if len(alerts) > 1:
+                occurrences = (
+                    f"{len(alerts)} occurrences between "
+                    f"{alerts[0]['timestamp']} and {alerts[-1]['timestamp']}"
+                )
+            else:
+                occurrences = f"1 occurrence at {alert['timestamp']}"
+            alert = dict(alert)
+            alert['timestamp'] = timestamp
+            alert['count'] = len(alerts)
+            alert['message'] = f"{alert['message']} ({occurrences})"
+        
+        if send:
+            self._handle_alert(alert, rule.notification_channels)
+        
+        with self.lock:
+            self._append_alert(alert, triggered_at.timestamp())
+            self._save_history(alert)
+    
+    def _append_alert(self, alert: Dict[str, Any], timestamp: float) -> None:
+        """Añade una alerta al historial en memoria (con ``self.lock`` adquirido).
+        
+        Los instantes son de reloj de pared, que puede retroceder (NTP,
+        cambios de hora) o venir desordenados de un archivo editado; en ese
+        caso la alerta se inserta en su posición para que la búsqueda binaria
+        de get_alert_history siga siendo válida.
+        
+        Args:
+            alert: Datos de la alerta
+            timestamp: Instante de la alerta en segundos epoch
+        """
+        if not self._alert_ts or timestamp >= self._alert_ts[-1]:
+            self.alert_history.append(alert)
+            self._alert_ts.append(timestamp)
+        else:
+            index = bisect_right(self._alert_ts, timestamp)
+            self.alert_history.insert(index, alert)
+            self._alert_ts.insert(index, timestamp)
+        if len(self.alert_history) > self.MAX_HISTORY:
+            del self.alert_history[:-self.MAX_HISTORY]
+            del self._alert_ts[:-self.MAX_HISTORY]
     
     def _handle_alert(
         self,
@@ -320,24 +504,54 @@ class AlertManager:
             )
             msg.attach(MIMEText(body, 'plain'))
             
-            with smtplib.SMTP(
-                self.email_config['smtp_host'],
-                self.email_config['smtp_port']
-            ) as server:
-                if self.email_config.get('use_tls'):
-                    server.starttls()
-                
-                if self.email_config.get('username'):
-                    server.login(
-                        self.email_config['username'],
-                        self.email_config['password']
-                    )
-                
-                server.send_message(msg)
+            if self.email_config.get('persistent'):
+                self._send_persistent_email(msg)
+            else:
+                with self._connect_smtp() as server:
+                    server.send_message(msg)
                 
         except Exception as e:
             logger.error(f"Error sending email alert: {str(e)}")
     
+    def _connect_smtp(self) -> smtplib.SMTP:
+        """Abre y autentica una conexión SMTP según ``email_config``.
+        
+        Returns:
+            smtplib.SMTP: Conexión lista para enviar
+        """
+        server = smtplib.SMTP(
+            self.email_config['smtp_host'],
+            self.email_config['smtp_port']
+        )
+        if self.email_config.get('use_tls'):
+            server.starttls()
+        
+        if self.email_config.get('username'):
+            server.login(
+                self.email_config['username'],
+                self.email_config['password']
+            )
+        
+        return server
+    
+    def _send_persistent_email(self, msg: MIMEMultipart) -> None:
+        """Envía un email reutilizando la conexión SMTP abierta.
+        
+        Si el servidor cerró la conexión, se abre una nueva y se reintenta.
+        
+        Args:
+            msg: Mensaje a enviar
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.send_message(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+        
+        self._smtp = self._connect_smtp()
+        self._smtp.send_message(msg)
+    
     def _send_slack_alert(self, alert: Dict[str, Any]) -> None:
         """Envía una alerta a Slack.
         
@@ -348,8 +562,6 @@ class AlertManager:
             return
             
         try:
-            import requests
-            
             color = (
                 'danger' if alert['severity'] == 'critical'
                 else 'warning'
@@ -378,30 +590,86 @@ class AlertManager:
                 }]
             }
             
-            response = requests.post(
+            response = self._get_http_session().post(
                 self.slack_config['webhook_url'],
-                json=payload
+                json=payload,
+                timeout=(3, 5)
             )
             response.raise_for_status()
             
         except Exception as e:
             logger.error(f"Error sending Slack alert: {str(e)}")
     
-    def _save_history(self) -> None:
-        """Guarda el historial de alertas."""
+    def _get_http_session(self):
+        """Devuelve la sesión HTTP compartida para los webhooks.
+        
+        La sesión mantiene viva la conexión con el servidor, de modo que las
+        alertas sucesivas no repiten el handshake TCP/TLS.
+        
+        Returns:
+            requests.Session: Sesión con reintentos ante fallos de conexión
+        """
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.3)
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._http = session
+        return self._http
+    
+    def _save_history(self, alert: Dict[str, Any]) -> None:
+        """Añade una alerta al archivo de historial.
+        
+        Debe llamarse con ``self.lock`` adquirido.
+        
+        Args:
+            alert: Alerta a guardar
+        """
         try:
-            os.makedirs(os.path.dirname(self.alert_history_file), exist_ok=True)
-            with open(self.alert_history_file, 'w') as f:
-                json.dump(self.alert_history, f, indent=4)
+            if self._history_fh is None:
+                directory = os.path.dirname(self.alert_history_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._history_fh = open(
+                    self.alert_history_file, 'a',
+                    encoding='utf-8', buffering=1 << 16
+                )
+            
+            self._history_fh.write(json.dumps(alert, separators=(',', ':')) + '\n')
+            self._history_fh.flush()
+            
+            if self._history_fh.tell() >= self.HISTORY_MAX_BYTES:
+                self._rotate_history()
         except Exception as e:
             logger.error(f"Error saving alert history: {str(e)}")
     
+    def _rotate_history(self) -> None:
+        """Rota el archivo de historial a "<archivo>.1" y empieza uno nuevo."""
+        self._history_fh.close()
+        self._history_fh = None
+        os.replace(self.alert_history_file, f"{self.alert_history_file}.1")
+    
     def _load_history(self) -> None:
-        """Carga el historial de alertas."""
+        """Carga el historial de alertas (las últimas MAX_HISTORY)."""
         try:
             if os.path.exists(self.alert_history_file):
-                with open(self.alert_history_file, 'r') as f:
-                    self.alert_history = json.load(f)
+                with open(self.alert_history_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        alert = json.loads(line)
+                        self._append_alert(
+                            alert,
+                            datetime.fromisoformat(alert['timestamp']).timestamp()
+                        )
         except Exception as e:
             logger.error(f"Error loading alert history: {str(e)}")
     
@@ -424,30 +692,16 @@ class AlertManager:
             List[Dict[str, Any]]: Alertas filtradas
         """
         with self.lock:
-            filtered = self.alert_history.copy()
-            
-            if start_time:
-                filtered = [
-                    alert for alert in filtered
-                    if datetime.fromisoformat(alert['timestamp']) >= start_time
-                ]
-            
-            if end_time:
-                filtered = [
-                    alert for alert in filtered
-                    if datetime.fromisoformat(alert['timestamp']) <= end_time
-                ]
-            
-            if severity:
-                filtered = [
-                    alert for alert in filtered
-                    if alert['severity'] == severity
-                ]
-            
-            if rule_name:
-                filtered = [
-                    alert for alert in filtered
-                    if alert['rule_name'] == rule_name
-                ]
+            # El rango temporal se localiza por búsqueda binaria sobre los
+            # instantes, que están en orden cronológico
+            lo = bisect_left(self._alert_ts, start_time.timestamp()) if start_time else 0
+            hi = (
+                bisect_right(self._alert_ts, end_time.timestamp())
+                if end_time else len(self._alert_ts)
+            )
             
-            return filtered 
\ No newline at end of file
+            return [
+                alert for alert in self.alert_history[lo:hi]
+                if (not severity or alert['severity'] == severity)
+                and (not rule_name or alert['rule_name'] == rule_name)
+            ] 
\ No newline at end of file
@@ -265,16 +265,26 @@ class BusinessDataPipeline:
             for chunk_file in chunk_files:
                 os.remove(chunk_file)
             
-            # Log final statistics
-            self.logger.info("Pipeline processing completed. Final statistics:")
-            self.logger.info(f"Total items processed: {self.stats['total_items']}")
-            self.logger.info(f"Valid items: {self.stats['valid_items']}")
-            self.logger.info(f"Invalid items: {self.stats['invalid_items']}")
-            self.logger.info(f"Processing errors: {self.stats['processing_errors']}")
-            self.logger.info(f"Chunks written: {self.stats['chunks_written']}")
-            self.logger.info(f"Total items saved: {self.processed_count}")
-            self.logger.info(f"Items skipped: {self.skipped_count}")
-            self.logger.info(f"Errors encountered: {self.error_count}")
+            # Log final statistics (a single record, formatted only if emitted)
+            self.logger.info(
+                "Pipeline processing completed. Final statistics:\n"
+                "Total items processed: %s\n"
+                "Valid items: %s\n"
+                "Invalid items: %s\n"
+                "Processing errors: %s\n"
+                "Chunks written: %s\n"
+                "Total items saved: %s\n"
+                "Items skipped: %s\n"
+                "Errors encountered: %s",
+                self.stats['total_items'],
+                self.stats['valid_items'],
+                self.stats['invalid_items'],
+                self.stats['processing_errors'],
+                self.stats['chunks_written'],
+                self.processed_count,
+                self.skipped_count,
+                self.error_count
+            )
             
         except Exception as e:
             self.logger.error(f"Error in spider cleanup: {str(e)}")
@@ -287,7 +287,7 @@ class BusinessSpider(scrapy.Spider):
         if not all_results:
             return self._create_empty_result(business_name)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         unique_results: Dict[str, Dict[str, Any]] = {}
         
         try:
@@ -308,7 +308,7 @@ class BusinessSpider(scrapy.Spider):
             )
 
             return self._create_result_response(
-                sorted_results, business_name, time.time() - start_time
+                sorted_results, business_name, time.perf_counter() - start_time
             )
 
         except Exception as e:
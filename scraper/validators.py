@@ -400,8 +400,13 @@ class BusinessValidator(BaseValidator):
                 return self.get_result()
         
         # Validar nombre del negocio
-        if not self._validate_business_name(data['business_name']):
+        name_ok, name_errors = self._validate_business_name(data['business_name'])
+        for message in name_errors:
+            self.add_error(message)
+        if not name_ok:
             return self.get_result()
+        for message in self._business_name_warnings(data['business_name']):
+            self.add_warning(message)
         
         # Validar dirección
         address_validator = AddressValidator()
@@ -423,37 +428,47 @@ class BusinessValidator(BaseValidator):
         
         return self.get_result()
     
-    def _validate_business_name(self, name: str) -> bool:
-        """Valida el nombre del negocio."""
+    def _validate_business_name(self, name: str) -> Tuple[bool, List[str]]:
+        """Valida el nombre del negocio.
+        
+        No modifica el estado del validador, por lo que puede llamarse desde
+        varios hilos o procesos.
+        
+        Returns:
+            Tuple[bool, List[str]]: Si el nombre es válido y los errores encontrados
+        """
         # Validar longitud
         if len(name) < 2:
-            self.add_error("Business name too short")
-            return False
+            return False, ["Business name too short"]
         
         # Validar palabras en lista negra
         name_lower = name.lower()
         for blacklisted in self.BUSINESS_NAME_BLACKLIST:
             if blacklisted in name_lower:
-                self.add_error(f"Business name contains invalid term: {blacklisted}")
-                return False
+                return False, [f"Business name contains invalid term: {blacklisted}"]
         
         # Validar caracteres especiales excesivos
         special_chars = sum(1 for c in name if not c.isalnum() and not c.isspace())
         if special_chars > len(name) * 0.3:
-            self.add_error("Business name contains too many special characters")
-            return False
+            return False, ["Business name contains too many special characters"]
+        
+        return True, []
+    
+    def _business_name_warnings(self, name: str) -> List[str]:
+        """Obtiene advertencias de formato del nombre del negocio."""
+        warnings: List[str] = []
         
         # Verificar palabras clave
-        words = set(name_lower.split())
+        words = set(name.lower().split())
         business_keywords = words.intersection(self.BUSINESS_NAME_KEYWORDS)
         
         if business_keywords:
             if 'inc' in words and not name.endswith(('Inc.', 'Inc', 'Incorporated')):
-                self.add_warning('Inconsistent Inc. formatting')
+                warnings.append('Inconsistent Inc. formatting')
             if 'llc' in words and not name.endswith(('LLC', 'L.L.C.')):
-                self.add_warning('Inconsistent LLC formatting')
+                warnings.append('Inconsistent LLC formatting')
         
-        return True
+        return warnings
     
     def _validate_url(self, url: str) -> bool:
         """Valida una URL."""
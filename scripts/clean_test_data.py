@@ -35,6 +35,7 @@ class TestDataCleaner:
             '*.json',
             '*.log',
             '*.gz',
+            '*.zst',
             '*.sqlite',
             '*.db'
         ]
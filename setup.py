@@ -54,6 +54,10 @@ setup(
             'PyQt5-sip>=12.17.0',
             'PyQt5-Qt5>=5.15.16',
             'PyQtWebKit>=5.15.6'
+        ],
+        'fast': [
+            'msgspec>=0.18.4',
+            'orjson>=3.8.0',
         ]
     },
     entry_points={
@@ -0,0 +1,252 @@
+"""Pruebas para la agregación de alertas de la caché."""
+
+import importlib
+import json
+import sys
+import types
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import scraper.config
+
+def _import_cache_alerts():
+    """Importa cache_alerts sustituyendo sus dependencias de monitorización.
+
+    El módulo importa ``.cache_monitor`` y ``CacheConfig``, que solo se usan
+    en anotaciones; se sustituyen durante la importación para probar la
+    lógica de alertas de forma aislada.
+    """
+    cache_monitor = types.ModuleType('scraper.monitoring.cache_monitor')
+    cache_monitor.CacheMonitor = object
+    with patch.dict(sys.modules, {'scraper.monitoring.cache_monitor': cache_monitor}), \
+         patch.object(scraper.config, 'CacheConfig', object, create=True):
+        sys.modules.pop('scraper.monitoring.cache_alerts', None)
+        return importlib.import_module('scraper.monitoring.cache_alerts')
+
+cache_alerts = _import_cache_alerts()
+AlertManager = cache_alerts.AlertManager
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+class FakeClock:
+    """Reloj controlado por la prueba para monotonic() y datetime.now()."""
+
+    def __init__(self):
+        self.offset = 0.0
+
+    def monotonic(self) -> float:
+        return 1000.0 + self.offset
+
+    def now(self) -> datetime:
+        return BASE_TIME + timedelta(seconds=self.offset)
+
+@pytest.fixture
+def clock():
+    """Reloj falso aplicado al módulo de alertas."""
+    fake = FakeClock()
+    fake_datetime = Mock(wraps=datetime)
+    fake_datetime.now = fake.now
+    with patch.object(cache_alerts.time, 'monotonic', fake.monotonic), \
+         patch.object(cache_alerts, 'datetime', fake_datetime):
+        yield fake
+
+@pytest.fixture
+def health():
+    """Estado del sistema devuelto por el monitor."""
+    return {
+        'system_availability': 100,
+        'healthy_nodes': 4,
+        'total_nodes': 4,
+        'avg_latency': 10,
+        'error_rate': 0
+    }
+
+@pytest.fixture
+def manager(tmp_path, health):
+    """Gestor de alertas sin reglas por defecto ni canales reales."""
+    monitor = Mock()
+    monitor.get_system_health.return_value = health
+    manager = AlertManager(
+        monitor,
+        Mock(),
+        alert_history_file=str(tmp_path / 'alerts.jsonl')
+    )
+    manager.rules = []
+    manager._handle_alert = Mock()
+    yield manager
+    manager.stop()
+
+def test_persistent_condition_respects_cooldown(manager, clock, health):
+    """Una condición persistente no notifica más veces que el cooldown."""
+    manager.add_rule(
+        name='low_availability',
+        condition=lambda stats: stats['system_availability'] < 90,
+        message_template='Availability {system_availability}%',
+        cooldown=300,
+        aggregation_window=60
+    )
+    health['system_availability'] = 50
+
+    # Diez minutos con chequeos cada 60 segundos
+    for second in range(0, 601, 60):
+        clock.offset = second
+        manager._check_alerts()
+
+    sent = [call.args[0] for call in manager._handle_alert.call_args_list]
+    assert len(sent) == 3
+    assert 'count' not in sent[0]
+    assert sent[1]['count'] == 5
+    assert manager.suppressed_count == 8
+
+def test_single_repetition_goes_to_history_only(manager, clock, health):
+    """Una repetición aislada al cerrar la ventana se guarda sin notificarse."""
+    manager.add_rule(
+        name='error_rate',
+        condition=lambda stats: stats['error_rate'] > 5,
+        message_template='Error rate {error_rate}%',
+        cooldown=60,
+        aggregation_window=300
+    )
+
+    health['error_rate'] = 10
+    for second in (0, 60):
+        clock.offset = second
+        manager._check_alerts()
+
+    health['error_rate'] = 0
+    for second in (120, 300, 360):
+        clock.offset = second
+        manager._check_alerts()
+
+    assert manager._handle_alert.call_count == 1
+    assert manager.suppressed_count == 1
+    history = manager.get_alert_history()
+    assert len(history) == 2
+    assert history[1]['count'] == 1
+    assert history[1]['timestamp'] == (BASE_TIME + timedelta(seconds=300)).isoformat()
+    assert (BASE_TIME + timedelta(seconds=60)).isoformat() in history[1]['message']
+
+def test_digest_keeps_history_in_order(manager, clock, health):
+    """Los resúmenes se fechan al enviarse y el historial sigue ordenado."""
+    manager.add_rule(
+        name='rule_a',
+        condition=lambda stats: stats['error_rate'] > 5,
+        message_template='Error rate {error_rate}%',
+        cooldown=60,
+        aggregation_window=300
+    )
+    manager.add_rule(
+        name='rule_b',
+        condition=lambda stats: stats['avg_latency'] > 100,
+        message_template='Latency {avg_latency}ms',
+        cooldown=60,
+        aggregation_window=60
+    )
+
+    health['error_rate'] = 10
+    for second in (0, 60, 120):
+        clock.offset = second
+        manager._check_alerts()
+
+    health['error_rate'] = 0
+    health['avg_latency'] = 200
+    for second in (180, 240, 300):
+        clock.offset = second
+        manager._check_alerts()
+
+    timestamps = list(manager._alert_ts)
+    assert timestamps == sorted(timestamps)
+
+    digest_time = BASE_TIME + timedelta(seconds=300)
+    history = manager.get_alert_history(start_time=digest_time, rule_name='rule_a')
+    assert len(history) == 1
+    assert history[0]['count'] == 2
+    assert history[0]['timestamp'] == digest_time.isoformat()
+
+def _history_alert(seconds: float, rule_name: str = 'rule') -> dict:
+    """Alerta de historial fechada a ``seconds`` de BASE_TIME."""
+    return {
+        'timestamp': (BASE_TIME + timedelta(seconds=seconds)).isoformat(),
+        'rule_name': rule_name,
+        'severity': 'warning',
+        'message': f'alert at {seconds}'
+    }
+
+def _add_error_rule(manager) -> None:
+    """Regla sin cooldown que se dispara con la tasa de error."""
+    manager.add_rule(
+        name='error_rate',
+        condition=lambda stats: stats['error_rate'] > 5,
+        message_template='Error rate {error_rate}%',
+        cooldown=0,
+        aggregation_window=0
+    )
+
+def test_history_range_filter_survives_clock_step_back(manager):
+    """El filtro por rango es correcto aunque el reloj de pared retroceda."""
+    with manager.lock:
+        for seconds in (0, 100, 200, 50, 300):
+            alert = _history_alert(seconds)
+            manager._append_alert(
+                alert, datetime.fromisoformat(alert['timestamp']).timestamp()
+            )
+
+    history = manager.get_alert_history(
+        start_time=BASE_TIME + timedelta(seconds=40),
+        end_time=BASE_TIME + timedelta(seconds=150)
+    )
+    assert [alert['message'] for alert in history] == ['alert at 50', 'alert at 100']
+    assert list(manager._alert_ts) == sorted(manager._alert_ts)
+
+def test_history_loaded_out_of_order_is_sorted(tmp_path):
+    """El historial de un archivo desordenado se filtra correctamente."""
+    history_file = tmp_path / 'alerts.jsonl'
+    history_file.write_text(
+        ''.join(json.dumps(_history_alert(seconds)) + '\n' for seconds in (300, 0, 200, 100)),
+        encoding='utf-8'
+    )
+
+    manager = AlertManager(Mock(), Mock(), alert_history_file=str(history_file))
+
+    history = manager.get_alert_history(start_time=BASE_TIME + timedelta(seconds=150))
+    assert [alert['message'] for alert in history] == ['alert at 200', 'alert at 300']
+
+def test_history_is_appended_as_json_lines(manager, clock, health, tmp_path):
+    """Cada alerta añade una línea JSON y el historial se recarga del archivo."""
+    _add_error_rule(manager)
+    health['error_rate'] = 10
+    for second in (0, 60, 120):
+        clock.offset = second
+        manager._check_alerts()
+    manager.stop()
+
+    history_file = tmp_path / 'alerts.jsonl'
+    lines = history_file.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['timestamp'] for line in lines] == [
+        (BASE_TIME + timedelta(seconds=second)).isoformat() for second in (0, 60, 120)
+    ]
+
+    reloaded = AlertManager(Mock(), Mock(), alert_history_file=str(history_file))
+    assert reloaded.get_alert_history() == [json.loads(line) for line in lines]
+
+def test_history_file_rotation(manager, clock, health, tmp_path, monkeypatch):
+    """El archivo de historial rota a ".1" al superar HISTORY_MAX_BYTES."""
+    monkeypatch.setattr(AlertManager, 'HISTORY_MAX_BYTES', 300)
+    _add_error_rule(manager)
+    health['error_rate'] = 10
+    for second in range(0, 600, 60):
+        clock.offset = second
+        manager._check_alerts()
+    manager.stop()
+
+    history_file = tmp_path / 'alerts.jsonl'
+    rotated_file = tmp_path / 'alerts.jsonl.1'
+    assert rotated_file.exists()
+    assert rotated_file.stat().st_size >= 300
+    assert history_file.stat().st_size < 300
+
+    # Tras reiniciar solo se carga el archivo actual
+    current = [json.loads(line) for line in history_file.read_text(encoding='utf-8').splitlines()]
+    reloaded = AlertManager(Mock(), Mock(), alert_history_file=str(history_file))
+    assert reloaded.get_alert_history() == current
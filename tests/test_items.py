@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Test suite for scraper items."""
 
+import json
 import unittest
+from unittest.mock import patch
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timedelta
 from typing import Dict, Any
-from scraper.items import BusinessItem, BusinessData
+from scraper.items import BusinessItem, BusinessData, MSGSPEC_AVAILABLE
 
 class TestBusinessData(unittest.TestCase):
     """Test cases for BusinessData class"""
@@ -69,6 +72,7 @@ class TestBusinessData(unittest.TestCase):
             ('business_name', 'A' * 201, ValueError, "length must be between"),
             ('address', '12', ValueError, "length must be between"),
             ('state', '123', ValueError, "must be a two-letter code"),
+            ('state', 'ZZ', ValueError, "must be a two-letter code"),
             ('zip_code', '123', ValueError, "must be in format"),
             ('created_at', '2024/01/01', ValueError, "must be in format")
         ]
@@ -98,6 +102,72 @@ class TestBusinessData(unittest.TestCase):
         self.assertEqual(data.state, 'NY')
         self.assertEqual(data.zip_code, '10001')
 
+    def test_from_dict_reuses_identical_rows(self):
+        """Test that identical rows share one validated instance"""
+        first = BusinessData.from_dict(self.valid_data)
+        second = BusinessData.from_dict(dict(self.valid_data))
+        self.assertIs(first, second)
+        
+        other = BusinessData.from_dict(self.create_data(id=2))
+        self.assertIsNot(first, other)
+
+    def test_from_json(self):
+        """Test creation from JSON documents"""
+        payload = json.dumps(self.valid_data).encode()
+        data = BusinessData.from_json(payload)
+        self.assertEqual(data, BusinessData(**self.valid_data))
+        
+        lines = b'\n'.join([payload, json.dumps(self.create_data(id=2)).encode()])
+        records = BusinessData.from_json_lines(lines)
+        self.assertEqual([record.id for record in records], [1, 2])
+        
+        with self.assertRaises(ValueError):
+            BusinessData.from_json(json.dumps(self.create_data(business_name='A')))
+        with self.assertRaises(ValueError):
+            BusinessData.from_json(json.dumps(self.create_data(id='not an int')))
+
+    def test_from_json_paths_agree(self):
+        """Test msgspec and json fallback decoding accept and reject the same input"""
+        accepted = [
+            (self.create_data(id='1', city='NYC'), 1),
+            (self.create_data(id=2.0), 2),
+            (self.create_data(id='3e0'), 3),
+        ]
+        rejected = [
+            self.create_data(id=True),
+            self.create_data(id='01'),
+            self.create_data(id=1.5),
+            self.create_data(id=' 1'),
+            self.create_data(state=5),
+            {'id': 1},
+            [self.valid_data],
+        ]
+        paths = [False, True] if MSGSPEC_AVAILABLE else [False]
+        
+        for msgspec_available in paths:
+            with patch('scraper.items.MSGSPEC_AVAILABLE', msgspec_available):
+                for data, expected_id in accepted:
+                    with self.subTest(msgspec=msgspec_available, data=data):
+                        record = BusinessData.from_json(json.dumps(data))
+                        self.assertEqual(record.id, expected_id)
+                for data in rejected:
+                    with self.subTest(msgspec=msgspec_available, data=data):
+                        with self.assertRaises(ValueError):
+                            BusinessData.from_json(json.dumps(data))
+
+    def test_created_at_formats(self):
+        """Test created_at accepts the same dates as DATE_FORMAT"""
+        for value in ('2024-01-01', '2024-1-1', '2024-01-1', '2024-1-01'):
+            with self.subTest(value=value):
+                business = BusinessData(**self.create_data(created_at=value))
+                self.assertEqual(business.created_at, value)
+        
+        for value in ('2024-02-30', '2024-13-01', '24-01-01', '2024-01-01 '):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError) as context:
+                    BusinessData(**self.create_data(created_at=value))
+                self.assertIn("must be in format", str(context.exception))
+
     def test_future_date_validation(self):
         """Test validation of future dates"""
         future_date = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
@@ -107,6 +177,20 @@ class TestBusinessData(unittest.TestCase):
             BusinessData(**data)
         self.assertIn("cannot be in the future", str(context.exception))
 
+    def test_immutability(self):
+        """Test that validated instances cannot be modified"""
+        data = BusinessData(**self.valid_data)
+        with self.assertRaises(FrozenInstanceError):
+            data.business_name = 'Other Business'
+
+    def test_default_created_at(self):
+        """Test created_at defaults to the current date"""
+        data = self.create_data()
+        del data['created_at']
+        
+        business = BusinessData(**data)
+        self.assertEqual(business.created_at, self.current_date)
+
     def test_required_fields(self):
         """Test required fields validation"""
         required_fields = BusinessData.REQUIRED_FIELDS
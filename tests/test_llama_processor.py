@@ -46,6 +46,23 @@ class TestLlamaProcessor(unittest.TestCase):
         expected = f"{business_name} business address location New York NY official records"
         self.assertEqual(result, expected)
 
+    def test_llama_relevance_truncates_description(self):
+        """Test single-result scoring keeps the description within the context"""
+        self.processor.model = MagicMock()
+        self.processor.model.return_value = {'choices': [{'text': '0.8'}]}
+        result = {
+            'title': 'Test Business',
+            'description': 'x' * 10000,
+            'url': 'https://example.com'
+        }
+
+        response = self.processor._calculate_llama_relevance(result)
+
+        self.assertTrue(response.success)
+        prompt = self.processor.model.call_args[0][0]
+        self.assertIn('x' * LlamaProcessor.DESCRIPTION_CHARS, prompt)
+        self.assertNotIn('x' * (LlamaProcessor.DESCRIPTION_CHARS + 1), prompt)
+
     def test_parse_llama_response(self):
         """Test LLaMA response parsing"""
         test_cases = {
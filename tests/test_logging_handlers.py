@@ -0,0 +1,166 @@
+"""Pruebas para los handlers y la configuración de logging."""
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+# scraper.settings y scraper.config se importan mutuamente; importar primero
+# scraper.config resuelve el ciclo
+import scraper.config  # noqa: F401
+from scraper import logging_config
+from scraper.logging_config import (
+    CompressedRotatingFileHandler,
+    CustomLogger,
+    LogQueueHandler,
+    get_logger,
+    setup_logging,
+    stop_logging
+)
+
+BACKUP_COUNT = 2
+
+def _drain_rotation_queue() -> None:
+    """Espera a que terminen las compresiones encoladas."""
+    CompressedRotatingFileHandler._rotation_executor.submit(lambda: None).result()
+
+def _record(message: str) -> logging.LogRecord:
+    """Registro INFO con el mensaje indicado."""
+    return logging.LogRecord('test', logging.INFO, __file__, 0, message, None, None)
+
+@pytest.fixture
+def rotating_handler(tmp_path):
+    """Handler que rota cada pocos registros."""
+    handler = CompressedRotatingFileHandler(
+        str(tmp_path / 'app.log'),
+        maxBytes=200,
+        backupCount=BACKUP_COUNT
+    )
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    yield handler
+    handler.close()
+
+def _backups(tmp_path):
+    """Archivos rotados junto al log principal."""
+    return sorted(path.name for path in tmp_path.iterdir() if path.name != 'app.log')
+
+def test_rollover_keeps_backup_count_compressed_backups(rotating_handler, tmp_path):
+    """Tras varias rotaciones quedan exactamente backupCount backups comprimidos."""
+    suffix = rotating_handler.rotation_filename('')
+    for i in range(60):
+        rotating_handler.emit(_record(f'message {i:03d} ' + 'x' * 40))
+    _drain_rotation_queue()
+
+    backups = _backups(tmp_path)
+    assert len(backups) == BACKUP_COUNT
+    for name in backups:
+        stamp = name[len('app.log.'):-len(suffix)]
+        assert name.endswith(suffix)
+        assert stamp.isdigit()
+
+def test_failed_compression_does_not_grow_backups(rotating_handler, tmp_path):
+    """Los archivos sin comprimir por un fallo también cuentan para backupCount."""
+    with patch.object(rotating_handler, 'rotate', lambda source, dest: None):
+        for i in range(60):
+            rotating_handler.emit(_record(f'message {i:03d} ' + 'x' * 40))
+        _drain_rotation_queue()
+
+    backups = _backups(tmp_path)
+    assert len(backups) == BACKUP_COUNT
+    assert all(name[len('app.log.'):].isdigit() for name in backups)
+
+def _settings(log_dir, rotate: bool = True) -> SimpleNamespace:
+    """Configuración mínima que usa setup_logging."""
+    return SimpleNamespace(
+        directories=SimpleNamespace(logs_dir=log_dir),
+        logging=SimpleNamespace(
+            level='INFO',
+            format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+            rotate=rotate,
+            max_size=1024 * 1024,
+            backup_count=BACKUP_COUNT,
+            json_format=False,
+            console_output=False
+        )
+    )
+
+@pytest.fixture
+def logging_setup():
+    """Restaura el root logger tras probar setup_logging."""
+    root_logger = logging.getLogger()
+    level = root_logger.level
+    yield
+    stop_logging()
+    root_logger.setLevel(level)
+
+def _read(path) -> str:
+    return path.read_text(encoding='utf-8')
+
+@pytest.mark.parametrize('rotate', [True, False])
+def test_setup_logging_writes_main_and_error_files(logging_setup, tmp_path, rotate):
+    """Los registros llegan al log principal y los errores, con traza, al de errores."""
+    setup_logging(_settings(tmp_path, rotate))
+    logger = logging.getLogger('scraper.test')
+
+    logger.info('info message')
+    try:
+        raise RuntimeError('boom')
+    except RuntimeError:
+        logger.exception('error message')
+    stop_logging()
+
+    main_log = _read(tmp_path / 'scraper.log')
+    error_log = _read(tmp_path / 'error.log')
+    assert 'info message' in main_log
+    assert 'error message' in main_log
+    assert 'RuntimeError: boom' in main_log
+    assert 'error message' in error_log
+    assert 'RuntimeError: boom' in error_log
+    assert 'info message' not in error_log
+
+def test_setup_logging_twice_does_not_duplicate_handlers(logging_setup, tmp_path):
+    """Repetir setup_logging reemplaza la configuración anterior."""
+    setup_logging(_settings(tmp_path))
+    setup_logging(_settings(tmp_path))
+
+    queue_handlers = [
+        handler for handler in logging.getLogger().handlers
+        if isinstance(handler, LogQueueHandler)
+    ]
+    assert len(queue_handlers) == 1
+    assert len(logging_config._queue_listener.handlers) == 2
+
+    logging.getLogger('scraper.test').warning('only once')
+    stop_logging()
+    assert _read(tmp_path / 'scraper.log').count('only once') == 1
+
+def test_buffered_records_flush_on_error_and_stop(logging_setup, tmp_path):
+    """Los registros por debajo de ERROR se escriben como tarde al detener el logging."""
+    setup_logging(_settings(tmp_path))
+    logger = logging.getLogger('scraper.test')
+
+    logger.error('flushed error')
+    logging_config._queue_listener.queue.join()
+    assert 'flushed error' in _read(tmp_path / 'error.log')
+
+    logger.info('buffered info')
+    stop_logging()
+    assert 'buffered info' in _read(tmp_path / 'scraper.log')
+
+def test_get_logger_promotes_only_plain_loggers():
+    """get_logger solo convierte a CustomLogger los logging.Logger sin subclase."""
+    class ThirdPartyLogger(logging.Logger):
+        pass
+
+    manager = logging.Logger.manager
+    plain = logging.Logger('tests.plain_logger')
+    third_party = ThirdPartyLogger('tests.third_party_logger')
+    with patch.dict(manager.loggerDict, {
+        plain.name: plain,
+        third_party.name: third_party
+    }):
+        assert isinstance(logging.getLogger('tests.new_logger'), CustomLogger)
+        assert type(get_logger(plain.name)) is CustomLogger
+        assert type(get_logger(third_party.name)) is ThirdPartyLogger
+        assert type(get_logger('')) is logging.RootLogger